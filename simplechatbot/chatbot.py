@@ -14,9 +14,101 @@ Learning Objectives:
 
 # Basic imports - only essential libraries for beginner programmers
 import boto3
+from botocore.config import Config
 import json
+import orjson
 import datetime
+import hashlib
+import sqlite3
+import sys
 import uuid
+from itertools import islice
+
+
+# Nova Lite settings shared by every request - built once, reused each turn
+INFERENCE_CONFIG = {
+    "maxTokens": 1000,
+    "temperature": 0.7,
+    "topP": 0.9
+}
+
+# Client settings: keep connections alive between turns and retry politely
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=5,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60
+)
+
+# Words that end the interactive chat (a set gives a quick membership check)
+EXIT_COMMANDS = frozenset({'quit', 'exit', 'bye', 'goodbye'})
+
+# Responses we already received, keyed by a hash of the exact request sent.
+# An identical request (same history, same settings) reuses the saved reply.
+RESPONSE_CACHE = {}
+RESPONSE_CACHE_SIZE = 256
+
+# Long conversations: keep this many recent messages word-for-word and replace
+# the older ones with a short summary, re-summarizing every few new messages
+RECENT_MESSAGE_WINDOW = 8
+SUMMARY_REFRESH_INTERVAL = 4
+
+# The summary is asked to stay under 200 tokens, so don't let it run longer
+SUMMARY_INFERENCE_CONFIG = {
+    "maxTokens": 250,
+    "temperature": 0.3,
+    "topP": 0.9
+}
+
+# SQLite file where the interactive chatbot saves each message as it is added
+MESSAGE_STORE_FILE = "chat.db"
+
+# How many recent messages debug_conversation_state lists one by one
+DEBUG_HISTORY_LIMIT = 20
+
+
+# Fixed text printed at the end of the educational demo (python chatbot.py)
+KEY_LEARNING_POINTS = (
+    "\n=== KEY LEARNING POINTS ===",
+    "1. The conversation started empty (LLM has no memory)",
+    "2. Each message was added by the APPLICATION",
+    "3. We can see the conversation grow step-by-step",
+    "4. Python dictionaries convert easily to JSON",
+    "5. JSON is the format used to communicate with APIs",
+    "6. The LLM will receive this ENTIRE history on each API call",
+    "7. All conversation memory is managed by OUR application!",
+)
+
+DEMO_SUMMARY_LINES = (
+    "\n=== EDUCATIONAL SUMMARY ===",
+    "What we've learned:",
+    "1. LLMs have no memory - conversations start empty",
+    "2. Applications manage all conversation state",
+    "3. JSON is used for data transfer between systems",
+    "4. AWS clients are just tools for making API calls",
+    "5. Each API call must include full conversation history",
+    "6. API requests grow larger as conversations get longer",
+    "7. We transform our data format to match API requirements",
+    "8. API responses contain only the current reply",
+    "9. We parse responses and add them to our conversation state",
+    "10. The conversation object grows with each exchange",
+)
+
+DEMO_COMPLETE_LINES = (
+    "\n" + "=" * 60,
+    "DEMO COMPLETE - TRY INTERACTIVE MODE!",
+    "=" * 60,
+    "You've seen all the core concepts in action!",
+    "\nNext steps:",
+    "  python chatbot.py interactive  # Interactive chatbot",
+    "  python chatbot.py stateless    # LLM statelessness demo",
+    "\nInteractive mode: Have real conversations with Nova Lite",
+    "Stateless demo: See proof that LLMs have no memory",
+    "\nBoth modes show conversation state management in action!",
+    "Use a debugger to step through the code line by line.",
+    "\nHappy learning! 🚀",
+)
 
 
 def create_new_conversation():
@@ -42,6 +134,9 @@ def create_new_conversation():
         "conversation_id": conversation_id,
         "created_at": current_time,
         "messages": [],  # Empty list - no messages yet!
+        "_api_messages": [],  # Private: same messages in Nova Lite format (never shown or saved)
+        "summary": None,  # Short summary of older messages (long chats only)
+        "summarized_count": 0,  # How many messages the summary covers
         "metadata": {
             "model": "amazon.nova-lite-v1:0",
             "total_messages": 0
@@ -49,14 +144,49 @@ def create_new_conversation():
     }
     
     print("New conversation created:")
-    print(json.dumps(new_conversation, indent=2))
+    print(json.dumps(visible_conversation(new_conversation), indent=2))
     print("Notice: messages list is empty - this proves LLM starts with no memory!")
     print("=" * 50)
     
     return new_conversation
 
 
-def add_message_to_conversation(conversation, role, message):
+def visible_conversation(conversation):
+    """
+    Returns the conversation without its private working data.
+    
+    Keys that start with "_" (like "_api_messages", a Nova Lite formatted copy
+    of the messages kept only to make requests faster) are not part of what
+    the application stores, so they are left out whenever the conversation is
+    displayed or converted to JSON.
+    
+    Args:
+        conversation (dict): The conversation dictionary
+        
+    Returns:
+        dict: Shallow copy of the conversation without the private keys
+    """
+    return {key: value for key, value in conversation.items() if not key.startswith("_")}
+
+
+def to_api_message(role, text):
+    """
+    Builds one message in the format Nova Lite expects.
+    
+    Args:
+        role (str): Either "user" or "assistant"
+        text (str): The message text
+        
+    Returns:
+        dict: Message with the text wrapped in a content list
+    """
+    return {
+        "role": role,
+        "content": [{"text": text}]  # Nova Lite requires content in this format
+    }
+
+
+def add_message_to_conversation(conversation, role, message, message_store=None):
     """
     Adds a new message to the conversation dictionary.
     
@@ -68,6 +198,8 @@ def add_message_to_conversation(conversation, role, message):
         conversation (dict): The conversation dictionary to update
         role (str): Either "user" or "assistant" 
         message (str): The message content to add
+        message_store (sqlite3.Connection): Optional database from
+            open_message_store - the message is also saved there
         
     Returns:
         dict: Updated conversation dictionary with new message
@@ -79,7 +211,7 @@ def add_message_to_conversation(conversation, role, message):
     # Show the conversation state before adding the message
     if conversation['messages']:
         print("Current conversation:")
-        print(json.dumps(conversation, indent=2))
+        print(json.dumps(visible_conversation(conversation), indent=2))
     else:
         print("Conversation is still empty")
     
@@ -93,12 +225,24 @@ def add_message_to_conversation(conversation, role, message):
     
     # Add the message to the conversation
     conversation['messages'].append(new_message)
+    
+    # Keep a Nova Lite formatted copy in step with the display messages,
+    # so preparing a request does not have to convert the whole history
+    conversation['_api_messages'].append(to_api_message(role, message))
     conversation['metadata']['total_messages'] = len(conversation['messages'])
     
+    # Save just this one message - no need to rewrite the whole history
+    if message_store is not None:
+        message_store.execute(
+            "INSERT INTO messages VALUES (?, ?, ?, ?)",
+            (conversation['conversation_id'], current_time, role, message)
+        )
+        print(f"✓ Saved {role} message to {MESSAGE_STORE_FILE}")
+    
     print(f"\nAFTER adding {role} message:")
     print(f"Total messages: {len(conversation['messages'])}")
     print("Updated conversation:")
-    print(json.dumps(conversation, indent=2))
+    print(json.dumps(visible_conversation(conversation), indent=2))
     print(f"Notice: The conversation object now contains {len(conversation['messages'])} message(s)")
     print("This shows how the APPLICATION maintains conversation history!")
     print("=" * 50)
@@ -118,7 +262,7 @@ def print_conversation_state(conversation):
     """
     print("\n=== CONVERSATION STATE ===")
     print("Current conversation as JSON:")
-    print(json.dumps(conversation, indent=2))
+    print(json.dumps(visible_conversation(conversation), indent=2))
     print(f"Total messages in conversation: {len(conversation['messages'])}")
     print(f"Conversation ID: {conversation['conversation_id']}")
     print(f"Created at: {conversation['created_at']}")
@@ -141,8 +285,9 @@ def conversation_to_json(conversation):
     print("\n=== JSON SERIALIZATION DEMO ===")
     print("Converting Python dictionary to JSON string...")
     
-    # Convert dictionary to JSON string
-    json_string = json.dumps(conversation, indent=2)
+    # Convert dictionary to JSON string (orjson produces bytes, so decode to text)
+    # (private working data like "_api_messages" is left out - see visible_conversation)
+    json_string = orjson.dumps(visible_conversation(conversation), option=orjson.OPT_INDENT_2).decode()
     
     print("Python dict → JSON string conversion complete!")
     print("JSON string length:", len(json_string), "characters")
@@ -173,7 +318,18 @@ def json_to_conversation(json_string):
     print("Converting JSON string back to Python dictionary...")
     
     # Parse JSON string back to dictionary
-    conversation_dict = json.loads(json_string)
+    conversation_dict = orjson.loads(json_string)
+    
+    # Rebuild the private Nova Lite copy of the messages (it is never saved)
+    if "messages" in conversation_dict:
+        conversation_dict["_api_messages"] = [
+            to_api_message(message["role"], message["content"])
+            for message in conversation_dict["messages"]
+        ]
+    
+    # Conversations saved before summaries existed don't have these keys
+    conversation_dict.setdefault("summary", None)
+    conversation_dict.setdefault("summarized_count", 0)
     
     print("JSON string → Python dict conversion complete!")
     print("This shows how we can:")
@@ -186,7 +342,87 @@ def json_to_conversation(json_string):
     return conversation_dict
 
 
-def print_state_change(before_conversation, after_conversation):
+def snapshot_conversation(conversation):
+    """
+    Records just enough about a conversation to show what changes later.
+    
+    Copying the whole message list before every change gets slower as the
+    conversation grows. A message count and the last message are all
+    print_state_change needs - any earlier message can still be found with
+    conversation['messages'][:snapshot['msg_count']].
+    
+    Args:
+        conversation (dict): The conversation dictionary to record
+        
+    Returns:
+        dict: Small snapshot with the message count and last message
+    """
+    messages = conversation['messages']
+    return {
+        "msg_count": len(messages),
+        "last_msg": messages[-1] if messages else None
+    }
+
+
+def open_message_store(database_file=MESSAGE_STORE_FILE):
+    """
+    Opens (or creates) the SQLite database used to save conversation messages.
+    
+    Saving the whole conversation as JSON after every turn means rewriting
+    every old message again and again. A database lets us add just the new
+    message each time. This is how real chat applications persist history.
+    
+    Args:
+        database_file (str): Path of the SQLite database file
+        
+    Returns:
+        sqlite3.Connection: Open database connection
+    """
+    print("\n=== OPENING MESSAGE STORE ===")
+    
+    # isolation_level=None saves each INSERT immediately (autocommit)
+    message_store = sqlite3.connect(database_file, isolation_level=None)
+    
+    # WAL mode makes small, frequent writes fast and crash-safe
+    message_store.execute("PRAGMA journal_mode=WAL")
+    message_store.execute("PRAGMA synchronous=NORMAL")
+    message_store.execute(
+        "CREATE TABLE IF NOT EXISTS messages "
+        "(conversation_id TEXT, timestamp TEXT, role TEXT, content TEXT)"
+    )
+    
+    print(f"✓ Messages will be saved to {database_file}")
+    print("This is APPLICATION storage - the LLM still remembers nothing!")
+    print("=" * 40)
+    
+    return message_store
+
+
+def load_messages_from_store(message_store, conversation_id):
+    """
+    Loads the saved messages of one conversation from the SQLite database.
+    
+    Args:
+        message_store (sqlite3.Connection): Database from open_message_store
+        conversation_id (str): ID of the conversation to load
+        
+    Returns:
+        list: Messages as dictionaries with role, content and timestamp
+    """
+    rows = message_store.execute(
+        "SELECT role, content, timestamp FROM messages "
+        "WHERE conversation_id = ? ORDER BY timestamp, rowid",
+        (conversation_id,)
+    )
+    
+    messages = []
+    for role, content, timestamp in rows:
+        messages.append({"role": role, "content": content, "timestamp": timestamp})
+    
+    return messages
+
+
+def print_state_change(before_state, after_conversation):
     """
     Shows the before and after states of a conversation to highlight changes.
     
@@ -194,18 +430,18 @@ def print_state_change(before_conversation, after_conversation):
     by showing exactly what changed between two states.
     
     Args:
-        before_conversation (dict): Conversation state before the change
+        before_state (dict): Snapshot from snapshot_conversation before the change
         after_conversation (dict): Conversation state after the change
     """
     print("\n=== CONVERSATION STATE CHANGE ===")
     
-    before_count = len(before_conversation['messages'])
+    before_count = before_state['msg_count']
     after_count = len(after_conversation['messages'])
     
     print(f"BEFORE: {before_count} messages")
     if before_count > 0:
         print("Last message before:")
-        print(json.dumps(before_conversation['messages'][-1], indent=2))
+        print(json.dumps(before_state['last_msg'], indent=2))
     else:
         print("No messages yet")
     
@@ -237,14 +473,20 @@ def debug_conversation_state(conversation, step_name):
     print(f"Model being used: {conversation['metadata']['model']}")
     
     if conversation['messages']:
+        # Only list the most recent messages - older ones add noise, not insight
+        total = len(conversation['messages'])
+        start = max(0, total - DEBUG_HISTORY_LIMIT)
         print("Message history:")
-        for i, message in enumerate(conversation['messages']):
-            print(f"  {i+1}. [{message['role']}]: {message['content'][:50]}...")
+        if start > 0:
+            print(f"  ... {start} older messages elided")
+        recent_messages = islice(conversation['messages'], start, None)
+        for i, message in enumerate(recent_messages, start=start + 1):
+            print(f"  {i}. [{message['role']}]: {message['content'][:50]}...")
     else:
         print("No messages yet - conversation is empty")
     
     print("\nFull conversation structure:")
-    print(json.dumps(conversation, indent=2))
+    print(json.dumps(visible_conversation(conversation), indent=2))
     print("=" * 50)
     
     # Pause for debugging (students can set breakpoints here)
@@ -265,8 +507,9 @@ def create_bedrock_client():
     print("\n=== CREATING BEDROCK CLIENT ===")
     print("Setting up AWS Bedrock client for Nova Lite model...")
     
-    # Create the Bedrock runtime client (assumes AWS credentials are configured)
-    client = boto3.client('bedrock-runtime')
+    # Create the Bedrock runtime client (assumes AWS credentials are configured).
+    # Create it once and reuse it - every new client pays for a fresh TLS handshake.
+    client = boto3.client('bedrock-runtime', config=BEDROCK_CLIENT_CONFIG)
     
     print("✓ Bedrock client created!")
     print("- Service: bedrock-runtime")
@@ -278,13 +521,84 @@ def create_bedrock_client():
     return client
 
 
+def summarize_older_messages(conversation, client):
+    """
+    Replaces older messages with a short summary once a conversation gets long.
+    
+    Sending every message on every turn makes each request bigger than the
+    last. This function asks Nova Lite to summarize everything except the most
+    recent RECENT_MESSAGE_WINDOW messages. prepare_bedrock_request then sends
+    the summary plus the recent messages instead of the whole history.
+    
+    The summary is only refreshed after SUMMARY_REFRESH_INTERVAL more messages
+    have aged out of the recent window, so most turns make no extra API call.
+    A refresh sends just the previous summary plus the newly aged-out messages,
+    so each summary request stays small no matter how long the chat gets.
+    
+    Args:
+        conversation (dict): The conversation dictionary to update
+        client: The boto3 Bedrock client
+        
+    Returns:
+        dict: Conversation dictionary with an up-to-date summary
+    """
+    # Messages alternate user/assistant starting with user (even positions),
+    # so start the recent window on an even position to keep that order
+    older_count = max(0, len(conversation['_api_messages']) - RECENT_MESSAGE_WINDOW)
+    older_count = older_count + older_count % 2
+    
+    if older_count - conversation['summarized_count'] < SUMMARY_REFRESH_INTERVAL:
+        return conversation
+    
+    print("\n=== SUMMARIZING OLDER MESSAGES ===")
+    print(f"Summarizing the first {older_count} messages to keep requests small...")
+    
+    # Turn only the messages the summary doesn't cover yet into a plain-text
+    # transcript - the older ones are already in the previous summary
+    transcript_lines = []
+    for message in conversation['messages'][conversation['summarized_count']:older_count]:
+        transcript_lines.append(f"{message['role']}: {message['content']}")
+    transcript = "\n".join(transcript_lines)
+    
+    prompt = ("Summarize this conversation in at most 200 tokens. "
+              "Keep names, facts and decisions.\n\n")
+    if conversation['summary']:
+        prompt += "Summary of the earlier conversation: " + conversation['summary'] + "\n\n"
+        prompt += "What was said after that:\n"
+    
+    summary_request = {
+        "messages": [
+            {
+                "role": "user",
+                "content": [{"text": prompt + transcript}]
+            }
+        ],
+        "inferenceConfig": SUMMARY_INFERENCE_CONFIG
+    }
+    summary_response = send_to_bedrock(client, summary_request)
+    
+    conversation['summary'] = extract_response_content(summary_response)
+    conversation['summarized_count'] = older_count
+    
+    print(f"✓ Summary now covers {older_count} messages")
+    print("The application decides what the LLM sees - it still has no memory!")
+    print("=" * 45)
+    
+    return conversation
+
+
 def prepare_bedrock_request(conversation):
     """
     Converts our conversation dictionary to Nova Lite API request format.
     
     This function shows students how to transform application data into the
     specific JSON format required by the Nova Lite API. It demonstrates
-    that we must send the ENTIRE conversation history with each request.
+    that the LLM only knows what we send it: for a short conversation that
+    is the ENTIRE conversation history with each request.
+    
+    Once a conversation has a summary (see summarize_older_messages), the
+    summarized messages are sent as a single system prompt instead, followed
+    by only the recent messages the summary doesn't cover.
     
     Args:
         conversation (dict): Our conversation dictionary
@@ -295,30 +609,29 @@ def prepare_bedrock_request(conversation):
     print("\n=== PREPARING BEDROCK API REQUEST ===")
     print("Converting conversation to Nova Lite API format...")
     
-    # Start with empty messages list for the API
-    api_messages = []
-    
-    # Convert each message in our conversation to Nova Lite format
-    for message in conversation['messages']:
-        api_message = {
-            "role": message['role'],
-            "content": [{"text": message['content']}]  # Nova Lite requires content in this format
-        }
-        api_messages.append(api_message)
-    
-    # Build the complete API request
+    # Messages are already stored in Nova Lite format by
+    # add_message_to_conversation, so we just reference that list
     bedrock_request = {
-        "messages": api_messages,
-        "inferenceConfig": {
-            "maxTokens": 1000,
-            "temperature": 0.7,
-            "topP": 0.9
-        }
+        "messages": conversation['_api_messages'],
+        "inferenceConfig": INFERENCE_CONFIG
     }
     
-    print(f"✓ Converted {len(conversation['messages'])} messages to API format")
-    print("IMPORTANT: Notice we're sending ALL previous messages!")
-    print("This proves the LLM gets the full conversation history each time.")
+    # Long conversation: send the summary plus only the messages it doesn't cover
+    # (.get() because conversations saved before summaries existed have no key)
+    if conversation.get('summary'):
+        bedrock_request["system"] = [
+            {"text": "Summary of the earlier conversation: " + conversation['summary']}
+        ]
+        bedrock_request["messages"] = conversation['_api_messages'][conversation['summarized_count']:]
+        print(f"✓ Using a summary of the first {conversation['summarized_count']} messages")
+    
+    print(f"✓ Included {len(bedrock_request['messages'])} messages in API format")
+    if conversation.get('summary'):
+        print("IMPORTANT: Older messages are sent as a summary, recent ones word-for-word!")
+        print("The LLM still only knows what we send it in this request.")
+    else:
+        print("IMPORTANT: Notice we're sending ALL previous messages!")
+        print("This proves the LLM gets the full conversation history each time.")
     print("=" * 45)
     
     return bedrock_request
@@ -371,9 +684,19 @@ def send_to_bedrock(client, request_data):
     print("\n=== SENDING REQUEST TO NOVA LITE ===")
     print("Making API call to amazon.nova-lite-v1:0...")
     
-    # Convert request dictionary to JSON string for the API
-    request_json = json.dumps(request_data)
-    print(f"Request size: {len(request_json)} characters")
+    # Convert request dictionary to JSON bytes for the API
+    # (orjson is a fast JSON library that produces bytes, which boto3 accepts)
+    request_json = orjson.dumps(request_data)
+    print(f"Request size: {len(request_json)} bytes")
+    
+    # Look for an identical earlier request (sorted keys so key order doesn't matter)
+    canonical_json = orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+    cache_key = hashlib.blake2b(canonical_json, digest_size=16).hexdigest()
+    if cache_key in RESPONSE_CACHE:
+        print("✓ Identical request sent before - reusing the saved response!")
+        print("No API call needed: same input history, same answer.")
+        print("=" * 40)
+        return RESPONSE_CACHE[cache_key]
     
     # Make the API call to Nova Lite
     response = client.invoke_model(
@@ -382,7 +705,12 @@ def send_to_bedrock(client, request_data):
     )
     
     # Parse the response
-    response_body = json.loads(response['body'].read())
+    response_body = orjson.loads(response['body'].read())
+    
+    # Save the response, dropping the oldest one once the cache is full
+    if len(RESPONSE_CACHE) >= RESPONSE_CACHE_SIZE:
+        del RESPONSE_CACHE[next(iter(RESPONSE_CACHE))]
+    RESPONSE_CACHE[cache_key] = response_body
     
     print("✓ Received response from Nova Lite!")
     print("The LLM processed our request and generated a response.")
@@ -452,7 +780,7 @@ def print_api_response(response):
     print("=" * 35)
 
 
-def process_conversation_turn(conversation, user_input, bedrock_client):
+def process_conversation_turn(conversation, user_input, bedrock_client, message_store=None):
     """
     Orchestrates a complete conversation turn with the LLM.
     
@@ -468,6 +796,7 @@ def process_conversation_turn(conversation, user_input, bedrock_client):
         conversation (dict): Current conversation dictionary
         user_input (str): The user's message
         bedrock_client: The boto3 Bedrock client
+        message_store (sqlite3.Connection): Optional database to save messages to
         
     Returns:
         dict: Updated conversation dictionary with new exchange
@@ -482,10 +811,12 @@ def process_conversation_turn(conversation, user_input, bedrock_client):
     
     # Step 2: Add user message to conversation
     print("\n=== STEP 2: ADDING USER MESSAGE ===")
-    conversation = add_message_to_conversation(conversation, "user", user_input)
+    conversation = add_message_to_conversation(conversation, "user", user_input, message_store)
     
-    # Step 3: Prepare API request (includes ALL conversation history)
+    # Step 3: Prepare API request (includes ALL conversation history,
+    # with older messages summarized once the conversation gets long)
     print("\n=== STEP 3: PREPARING API REQUEST ===")
+    conversation = summarize_older_messages(conversation, bedrock_client)
     api_request = prepare_bedrock_request(conversation)
     print_api_request(api_request)
     
@@ -500,7 +831,7 @@ def process_conversation_turn(conversation, user_input, bedrock_client):
     
     # Step 6: Add assistant response to conversation
     print("\n=== STEP 6: ADDING ASSISTANT RESPONSE ===")
-    conversation = add_message_to_conversation(conversation, "assistant", assistant_message)
+    conversation = add_message_to_conversation(conversation, "assistant", assistant_message, message_store)
     
     # Step 7: Show final conversation state
     print("\n=== STEP 7: FINAL CONVERSATION STATE ===")
@@ -540,6 +871,7 @@ def main():
     print("\nInstructions:")
     print("• Type your messages and press Enter")
     print("• Type 'quit' or 'exit' to end the conversation")
+    print("• Use the up/down arrow keys to recall previous messages")
     print("• Watch how the conversation object grows with each exchange")
     print("• Use a debugger to step through the code line by line")
     print("="*70)
@@ -548,6 +880,13 @@ def main():
     print("\n=== INITIALIZING CHATBOT ===")
     conversation = create_new_conversation()
     bedrock_client = create_bedrock_client()
+    message_store = open_message_store()
+    
+    # Prompt with line editing and up-arrow history saved between runs
+    # (imported here, so the helper functions work without prompt_toolkit)
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+    prompt_session = PromptSession(history=FileHistory(".chatbot_history"))
     
     print("\n✓ Chatbot ready! Starting conversation loop...")
     print("✓ Remember: The LLM starts with NO knowledge of previous conversations!")
@@ -558,13 +897,13 @@ def main():
         
         # Get user input
         try:
-            user_input = input("\nYou: ").strip()
-        except KeyboardInterrupt:
+            user_input = prompt_session.prompt("\nYou: ").strip()
+        except (KeyboardInterrupt, EOFError):
             print("\n\nGoodbye! Thanks for learning about LLM state management!")
             break
         
         # Check for exit commands
-        if user_input.lower() in ['quit', 'exit', 'bye', 'goodbye']:
+        if user_input.lower() in EXIT_COMMANDS:
             print("\nEnding conversation...")
             break
         
@@ -575,7 +914,7 @@ def main():
         
         # Process the conversation turn
         try:
-            conversation = process_conversation_turn(conversation, user_input, bedrock_client)
+            conversation = process_conversation_turn(conversation, user_input, bedrock_client, message_store)
             
             # Show conversation summary after each turn
             print(f"\n=== CONVERSATION SUMMARY ===")
@@ -613,6 +952,11 @@ def main():
         print(f"\nYour conversation grew to {len(conversation['messages'])} messages!")
         print("All of this state was maintained by the APPLICATION, not the LLM.")
     
+    # Read the conversation back from the database to show it was persisted
+    saved_messages = load_messages_from_store(message_store, conversation['conversation_id'])
+    print(f"\n{len(saved_messages)} messages were saved to {MESSAGE_STORE_FILE} as you chatted.")
+    message_store.close()
+    
     print("\nThanks for learning about LLM state management! 🤖")
 
 
@@ -688,11 +1032,7 @@ def demonstrate_llm_statelessness():
                 "content": [{"text": "Do you remember my name?"}]
             }
         ],
-        "inferenceConfig": {
-            "maxTokens": 1000,
-            "temperature": 0.7,
-            "topP": 0.9
-        }
+        "inferenceConfig": INFERENCE_CONFIG
     }
     
     print("\nRequest with NO conversation history:")
@@ -738,8 +1078,6 @@ def demonstrate_llm_statelessness():
 
 # Test the basic functions when this file is run directly
 if __name__ == "__main__":
-    import sys
-    
     # Check command line arguments
     if len(sys.argv) > 1:
         if sys.argv[1] == "interactive":
@@ -780,8 +1118,7 @@ if __name__ == "__main__":
     print("="*60)
     
     # Save state before first message
-    before_state = conversation.copy()
-    before_state['messages'] = conversation['messages'].copy()
+    before_state = snapshot_conversation(conversation)
     
     # Add first message
     conversation = add_message_to_conversation(conversation, "user", "Hello, chatbot!")
@@ -791,8 +1128,7 @@ if __name__ == "__main__":
     debug_conversation_state(conversation, "After first user message")
     
     # Save state before second message
-    before_state = conversation.copy()
-    before_state['messages'] = conversation['messages'].copy()
+    before_state = snapshot_conversation(conversation)
     
     # Make real API call to get assistant response
     api_request = prepare_bedrock_request(conversation)
@@ -809,8 +1145,7 @@ if __name__ == "__main__":
     debug_conversation_state(conversation, "After assistant response")
     
     # Add one more exchange to show continued growth
-    before_state = conversation.copy()
-    before_state['messages'] = conversation['messages'].copy()
+    before_state = snapshot_conversation(conversation)
     
     conversation = add_message_to_conversation(conversation, "user", "Can you explain how you remember our conversation?")
     print_state_change(before_state, conversation)
@@ -835,14 +1170,8 @@ if __name__ == "__main__":
     
     print_conversation_state(conversation)
     
-    print("\n=== KEY LEARNING POINTS ===")
-    print("1. The conversation started empty (LLM has no memory)")
-    print("2. Each message was added by the APPLICATION")
-    print("3. We can see the conversation grow step-by-step")
-    print("4. Python dictionaries convert easily to JSON")
-    print("5. JSON is the format used to communicate with APIs")
-    print("6. The LLM will receive this ENTIRE history on each API call")
-    print("7. All conversation memory is managed by OUR application!")
+    # Static text blocks are written in one call instead of one print per line
+    sys.stdout.write("\n".join(KEY_LEARNING_POINTS) + "\n")
     
     print(f"\nFinal conversation contains {len(conversation['messages'])} messages")
     
@@ -909,28 +1238,5 @@ if __name__ == "__main__":
     print("✓ Response processing: READY")
     print("\nNext step: Create the main chatbot loop!")
     
-    print("\n=== EDUCATIONAL SUMMARY ===")
-    print("What we've learned:")
-    print("1. LLMs have no memory - conversations start empty")
-    print("2. Applications manage all conversation state")
-    print("3. JSON is used for data transfer between systems")
-    print("4. AWS clients are just tools for making API calls")
-    print("5. Each API call must include full conversation history")
-    print("6. API requests grow larger as conversations get longer")
-    print("7. We transform our data format to match API requirements")
-    print("8. API responses contain only the current reply")
-    print("9. We parse responses and add them to our conversation state")
-    print("10. The conversation object grows with each exchange")
-    
-    print("\n" + "="*60)
-    print("DEMO COMPLETE - TRY INTERACTIVE MODE!")
-    print("="*60)
-    print("You've seen all the core concepts in action!")
-    print("\nNext steps:")
-    print("  python chatbot.py interactive  # Interactive chatbot")
-    print("  python chatbot.py stateless    # LLM statelessness demo")
-    print("\nInteractive mode: Have real conversations with Nova Lite")
-    print("Stateless demo: See proof that LLMs have no memory")
-    print("\nBoth modes show conversation state management in action!")
-    print("Use a debugger to step through the code line by line.")
-    print("\nHappy learning! 🚀")
\ No newline at end of file
+    sys.stdout.write("\n".join(DEMO_SUMMARY_LINES) + "\n")
+    sys.stdout.write("\n".join(DEMO_COMPLETE_LINES) + "\n")
\ No newline at end of file
@@ -4,18 +4,32 @@ Simple Chatbot - Minimal LLM conversation loop
 A bare-bones chatbot that demonstrates:
 - User input loop
 - Conversation memory in a list
-- Real API calls to Nova Lite
+- Real API calls to Nova Lite (streamed as they arrive)
 - No tests, demos, or educational features
 """
 
 import boto3
-import json
+from botocore.config import Config
+import orjson
+
+
+# Reuse connections between turns and retry throttled calls adaptively
+CLIENT_CONFIG = Config(
+    max_pool_connections=5,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=60
+)
+
+# The settings never change, so serialize them once and splice them into each request
+INFERENCE_CONFIG_JSON = orjson.dumps({"maxTokens": 1000, "temperature": 0.7})
 
 
 def main():
     """Simple chatbot loop"""
     # Setup
-    client = boto3.client('bedrock-runtime')
+    client = boto3.client('bedrock-runtime', config=CLIENT_CONFIG)
     conversation = []
     
     print("Simple Chatbot (type 'quit' to exit)")
@@ -35,30 +49,29 @@ def main():
         # Add user message to conversation
         conversation.append({"role": "user", "content": [{"text": user_input}]})
         
-        # Prepare API request
-        request = {
-            "messages": conversation,
-            "inferenceConfig": {
-                "maxTokens": 1000,
-                "temperature": 0.7
-            }
-        }
+        # Prepare API request: {"messages": [...], "inferenceConfig": {...}} as JSON bytes
+        request_body = (b'{"messages":' + orjson.dumps(conversation)
+                        + b',"inferenceConfig":' + INFERENCE_CONFIG_JSON + b'}')
         
-        # Call Nova Lite via inference profile
-        response = client.invoke_model(
+        # Call Nova Lite via inference profile, streaming the reply as it's generated
+        response = client.invoke_model_with_response_stream(
             modelId="us.amazon.nova-lite-v1:0",
-            body=json.dumps(request)
+            body=request_body
         )
         
-        # Parse response
-        response_body = json.loads(response['body'].read())
-        assistant_message = response_body['output']['message']
+        # Show each piece of text as soon as it arrives
+        print("Assistant: ", end="", flush=True)
+        reply_parts = []
+        for event in response['body']:
+            chunk = orjson.loads(event['chunk']['bytes'])
+            if 'contentBlockDelta' in chunk:
+                text = chunk['contentBlockDelta']['delta'].get('text', '')
+                reply_parts.append(text)
+                print(text, end="", flush=True)
+        print()
         
         # Add assistant response to conversation
-        conversation.append(assistant_message)
-        
-        # Show response
-        print(f"Assistant: {assistant_message['content'][0]['text']}")
+        conversation.append({"role": "assistant", "content": [{"text": "".join(reply_parts)}]})
 
 
 if __name__ == "__main__":
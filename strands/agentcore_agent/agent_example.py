@@ -1,4 +1,6 @@
 import os
+import boto3
+from botocore.config import Config
 from strands import Agent, tool
 from strands.models import BedrockModel
 from strands_tools import shell
@@ -29,25 +31,44 @@ def letter_counter(word: str, letter: str) -> int:
     if len(letter) != 1:
         raise ValueError("The 'letter' parameter must be a single character")
 
+    # Count both cases directly instead of lowercasing a copy of the whole word.
+    # That shortcut is only exact for ASCII: other letters can change length or
+    # map to a different letter when their case changes ('ß'.upper() == 'SS')
+    if word.isascii() and letter.isascii():
+        lower, upper = letter.lower(), letter.upper()
+        if lower == upper:
+            return word.count(letter)
+        return word.count(lower) + word.count(upper)
     return word.lower().count(letter.lower())
 
+# Create the session and model once when the worker starts, so each
+# invocation reuses the same pooled Bedrock connections
+boto_session = boto3.Session()
+client_config = Config(
+    max_pool_connections=10,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+bedrock_model = BedrockModel(
+    model_id="us.amazon.nova-pro-v1:0",
+    boto_session=boto_session,
+    boto_client_config=client_config,
+    temperature=0.3,
+    top_p=0.8,
+)
+
 @app.entrypoint
 def invoke(payload):
     """Process user input and return a response"""
-    # Create a Bedrock model instance
-    bedrock_model = BedrockModel(
-        model_id="us.amazon.nova-pro-v1:0",
-        temperature=0.3,
-        top_p=0.8,
-    )
-
-    # Initialize agent inside the entrypoint
+    # A fresh agent per invocation keeps each conversation history separate,
+    # even when AgentCore runs several invocations at the same time
     agent = Agent(
         system_prompt="You are a helpful agent.",
         model=bedrock_model,
         tools=[shell, letter_counter],
     )
-    
+
     user_message = payload.get("prompt", "Hello! I'm a helpful agent with shell access and custom tools.")
     result = agent(user_message)
     return {"result": str(result.message)}
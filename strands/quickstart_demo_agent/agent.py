@@ -1,6 +1,8 @@
 import logging
 import boto3 # type: ignore
 import os
+import sys
+from botocore.config import Config # type: ignore
 from dotenv import load_dotenv # type: ignore
 # from strands import logger # type: ignore
 from strands import Agent, tool # type: ignore
@@ -62,29 +64,48 @@ def letter_counter(word: str, letter: str) -> int:
     if len(letter) != 1:
         raise ValueError("The 'letter' parameter must be a single character")
 
+    # Count both cases directly instead of lowercasing a copy of the whole word.
+    # That shortcut is only exact for ASCII: other letters can change length or
+    # map to a different letter when their case changes ('ß'.upper() == 'SS')
+    if word.isascii() and letter.isascii():
+        lower, upper = letter.lower(), letter.upper()
+        if lower == upper:
+            return word.count(letter)
+        return word.count(lower) + word.count(upper)
     return word.lower().count(letter.lower())
 
 
-# Create a BedrockModel
+# Create one boto3 session so credentials are resolved once, and a client
+# config that keeps connections alive and retries throttled calls
+boto_session = boto3.Session(region_name="us-west-2")
+client_config = Config(
+    max_pool_connections=10,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Create a BedrockModel (the region comes from the session)
 bedrock_model = BedrockModel(
     model_id=MODEL_ID,
-    region_name="us-west-2",
+    boto_session=boto_session,
+    boto_client_config=client_config,
     temperature=0.3,
 )
 
 # callback handler for agent
 # Define a simple callback handler that logs instead of printing
-tool_use_ids = []
+tool_use_ids = set()
 def callback_handler(**kwargs):
-    if "data" in kwargs:
-        # Print the streamed data chunks
-        print(kwargs["data"], end="")
-    elif "current_tool_use" in kwargs:
-        tool = kwargs["current_tool_use"]
-        if tool["toolUseId"] not in tool_use_ids:
-            # Print the tool use
-            print(f"\n[Using tool: {tool.get('name')}]")
-            tool_use_ids.append(tool["toolUseId"])
+    data = kwargs.get("data")
+    if data is not None:
+        # Write the streamed data chunks (flushed once after the agent call)
+        sys.stdout.write(data)
+        return
+    tool = kwargs.get("current_tool_use")
+    if tool is not None and tool["toolUseId"] not in tool_use_ids:
+        # Print the tool use
+        print(f"\n[Using tool: {tool.get('name')}]")
+        tool_use_ids.add(tool["toolUseId"])
 
 # Create an agent with tools from the community-driven strands-tools package
 # as well as our custom letter_counter tool
@@ -107,6 +128,7 @@ I have 4 requests:
 """
 
 result = agent(message)
+sys.stdout.flush()
 # print(result.metrics.get_summary())
 
 
@@ -1,11 +1,16 @@
+import sys
 from strands import Agent
 from strands_tools import calculator
 
 def streaming_handler(**kwargs):
-    if "data" in kwargs:
-        print(kwargs["data"], end="", flush=True)
-    elif "current_tool_use" in kwargs and kwargs["current_tool_use"].get("name"):
-        print(f"\n[Tool use: {kwargs['current_tool_use']['name']}]")
+    data = kwargs.get("data")
+    if data is not None:
+        sys.stdout.write(data)
+        sys.stdout.flush()  # Show each token as soon as it arrives - that's the point of streaming
+        return
+    tool = kwargs.get("current_tool_use")
+    if tool is not None and tool.get("name"):
+        print(f"\n[Tool use: {tool['name']}]")
 
 # Agent with callback handler
 agent = Agent(
@@ -1,5 +1,6 @@
 from strands import Agent
 from strands.models import BedrockModel
+from aws_session import SESSION, CLIENT_CONFIG
 """
 Now we are using the explisit Strand's Bedrock Model class so we can set our own parameters 
 including the model we want to use
@@ -7,6 +8,8 @@ including the model we want to use
 # Create a Bedrock model instance
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-premier-v1:0",
+    boto_session=SESSION,
+    boto_client_config=CLIENT_CONFIG,
     temperature=0.3,
     top_p=0.8,
 )
@@ -1,10 +1,13 @@
 import json
 from strands import Agent
 from strands.models import BedrockModel
+from aws_session import SESSION, CLIENT_CONFIG
 
 # Create a Bedrock model with guardrail configuration
 bedrock_model = BedrockModel(
     model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+    boto_session=SESSION,
+    boto_client_config=CLIENT_CONFIG,
     guardrail_id="jdsfcyfinj12",         # Your Bedrock guardrail ID
     guardrail_version="1",                    # Guardrail version
     guardrail_trace="enabled",                # Enable trace info for debugging
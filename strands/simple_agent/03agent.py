@@ -1,5 +1,6 @@
 from strands import Agent
 from strands.models import BedrockModel
+from aws_session import SESSION, CLIENT_CONFIG
 from strands_tools import shell
 
 """
@@ -8,6 +9,8 @@ using a tool that comes as part of the Strands API.
 # Create a Bedrock model instance
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-premier-v1:0",
+    boto_session=SESSION,
+    boto_client_config=CLIENT_CONFIG,
     temperature=0.3,
     top_p=0.8,
 )
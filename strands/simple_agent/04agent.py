@@ -1,5 +1,6 @@
 from strands import Agent, tool #import the tool module
 from strands.models import BedrockModel
+from aws_session import SESSION, CLIENT_CONFIG
 from strands_tools import shell
 
 """
@@ -25,6 +26,14 @@ def letter_counter(word: str, letter: str) -> int:
     if len(letter) != 1:
         raise ValueError("The 'letter' parameter must be a single character")
 
+    # Count both cases directly instead of lowercasing a copy of the whole word.
+    # That shortcut is only exact for ASCII: other letters can change length or
+    # map to a different letter when their case changes ('ß'.upper() == 'SS')
+    if word.isascii() and letter.isascii():
+        lower, upper = letter.lower(), letter.upper()
+        if lower == upper:
+            return word.count(letter)
+        return word.count(lower) + word.count(upper)
     return word.lower().count(letter.lower())
 
 
@@ -32,6 +41,8 @@ def letter_counter(word: str, letter: str) -> int:
 # Create a Bedrock model instance
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-pro-v1:0",
+    boto_session=SESSION,
+    boto_client_config=CLIENT_CONFIG,
     temperature=0.3,
     top_p=0.8,
 )
@@ -1,6 +1,7 @@
 from mcp import StdioServerParameters, stdio_client
 from strands import Agent, tool
 from strands.models import BedrockModel
+from aws_session import SESSION, CLIENT_CONFIG
 from strands_tools import shell
 from strands.tools.mcp import MCPClient
 
@@ -27,6 +28,14 @@ def letter_counter(word: str, letter: str) -> int:
     if len(letter) != 1:
         raise ValueError("The 'letter' parameter must be a single character")
 
+    # Count both cases directly instead of lowercasing a copy of the whole word.
+    # That shortcut is only exact for ASCII: other letters can change length or
+    # map to a different letter when their case changes ('ß'.upper() == 'SS')
+    if word.isascii() and letter.isascii():
+        lower, upper = letter.lower(), letter.upper()
+        if lower == upper:
+            return word.count(letter)
+        return word.count(lower) + word.count(upper)
     return word.lower().count(letter.lower())
 
 # Create MCP client for strands-agents server
@@ -41,6 +50,8 @@ stdio_mcp_client = MCPClient(lambda: stdio_client(
 # Create a Bedrock model instance
 bedrock_model = BedrockModel(
     model_id="us.amazon.nova-pro-v1:0",
+    boto_session=SESSION,
+    boto_client_config=CLIENT_CONFIG,
     temperature=0.3,
     top_p=0.8,
 )
@@ -50,7 +61,7 @@ with stdio_mcp_client:
     tools = stdio_mcp_client.list_tools_sync()
     print(f"TOOLS:  {tools}")
     # Create an agent with these tools
-    agent = Agent(tools=tools)
+    agent = Agent(model=bedrock_model, tools=tools)
     agent("tell me about bedrock agent builder")
 
 
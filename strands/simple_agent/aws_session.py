@@ -0,0 +1,17 @@
+"""
+One boto3 session and client config shared by the agents in this folder.
+
+Passing the same session to every BedrockModel means credentials are looked
+up once, and the config keeps connections alive and retries throttled calls.
+"""
+
+import boto3
+from botocore.config import Config
+
+SESSION = boto3.Session()
+
+CLIENT_CONFIG = Config(
+    max_pool_connections=10,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
@@ -0,0 +1,149 @@
+"""
+Game Harness - plays one tic-tac-toe game file many times in one process
+
+Starting Python takes a noticeable moment, so instead of launching a new
+interpreter for every test game, test_games.py starts this harness once
+per game file and sends it one game after another.
+
+How it talks to test_games.py (everything goes through stdin/stdout):
+    request:  b"<input length>\\n" followed by the simulated keyboard input
+    reply:    b"<return code> <stdout length> <stderr length>\\n"
+              followed by the game's stdout and then its stderr
+
+As soon as a game announces a winner or a tie, the harness stops it and
+replies right away - the tests only need to see that announcement, not the
+final board or the play-again question.
+
+Usage: python game_harness.py tictactoe_lists.py
+"""
+
+import io
+import os
+import re
+import signal
+import sys
+import traceback
+
+# Give up on a single game after this many seconds (same limit as before)
+GAME_TIMEOUT = 30
+
+# How each game result is announced. This is the one place these are defined:
+# the harness uses them to spot the end of a game, and test_games.py uses
+# them to check who won. \b keeps "tie" from matching inside other words.
+RESULT_REGEXES = {
+    'X': r'\bx wins\b',
+    'O': r'\bo wins\b',
+    'Tie': r'\b(tie|draw)\b',
+}
+
+# Any one of the results above means the game is over
+GAME_OVER_PATTERN = re.compile('|'.join(RESULT_REGEXES.values()), re.IGNORECASE)
+
+
+# Both signals below inherit from BaseException, not Exception, so a game that
+# wraps its input loop in "except Exception:" can't accidentally swallow them
+# (the same reason KeyboardInterrupt and SystemExit are BaseExceptions)
+
+class GameTimeout(BaseException):
+    """Raised inside a game that ran longer than GAME_TIMEOUT."""
+
+
+class GameFinished(BaseException):
+    """Raised inside a game right after it announces the result."""
+
+
+class GameOutput(io.StringIO):
+    """Collects a game's stdout and ends the game once the result is printed."""
+
+    def write(self, text):
+        count = super().write(text)
+        if GAME_OVER_PATTERN.search(text):
+            raise GameFinished()
+        return count
+
+
+def _on_alarm(signum, frame):
+    raise GameTimeout()
+
+
+def run_once(code, game_file, input_text):
+    """
+    Run the compiled game once, as if it was started with `python game_file`.
+
+    Args:
+        code: The game's source compiled with compile()
+        game_file: Path of the game file (used for __file__ and tracebacks)
+        input_text: Everything the "player" types, one move per line
+
+    Returns:
+        Tuple of (return_code, stdout_text, stderr_text)
+    """
+    fake_stdout = GameOutput()
+    fake_stderr = io.StringIO()
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(input_text), fake_stdout, fake_stderr
+
+    # A brand new globals dictionary means every game starts from a clean slate
+    game_globals = {"__name__": "__main__", "__file__": game_file}
+    return_code = 0
+
+    if hasattr(signal, "alarm"):
+        signal.alarm(GAME_TIMEOUT)
+    try:
+        exec(code, game_globals)
+    except GameFinished:
+        pass  # The result is in fake_stdout; that's a successful run
+    except GameTimeout:
+        fake_stdout.seek(0)
+        fake_stdout.truncate()
+        fake_stderr.write("Test timed out")
+        return_code = -1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return_code = e.code or 0
+        else:
+            print(e.code, file=fake_stderr)
+            return_code = 1
+    except BaseException as e:
+        # Print the traceback the way Python would, without the harness frame
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return_code = 1
+    finally:
+        if hasattr(signal, "alarm"):
+            signal.alarm(0)
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+
+    return return_code, fake_stdout.getvalue(), fake_stderr.getvalue()
+
+
+def main():
+    """Read game requests until test_games.py closes our stdin."""
+    game_file = os.path.abspath(sys.argv[1])
+    with open(game_file, encoding="utf-8") as file:
+        code = compile(file.read(), game_file, "exec")
+
+    if hasattr(signal, "alarm"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    # Keep the raw byte streams: sys.stdin/sys.stdout are swapped during a game
+    requests_in = sys.stdin.buffer
+    replies_out = sys.stdout.buffer
+
+    while True:
+        header = requests_in.readline()
+        if not header:
+            break  # test_games.py is done with us
+
+        input_text = requests_in.read(int(header)).decode("utf-8")
+        return_code, stdout_text, stderr_text = run_once(code, game_file, input_text)
+
+        stdout_bytes = stdout_text.encode("utf-8")
+        stderr_bytes = stderr_text.encode("utf-8")
+        replies_out.write(b"%d %d %d\n" % (return_code, len(stdout_bytes), len(stderr_bytes)))
+        replies_out.write(stdout_bytes)
+        replies_out.write(stderr_bytes)
+        replies_out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,36 @@
 # This file teaches: indexing, negative indexing, slicing, append, pop, and looping
 # We progress from EASY to HARDER concepts
 
+# NumPy is an external library (pip install numpy) for fast math on lists of numbers.
+# A few examples below show the NumPy way next to the plain-list way.
+import numpy as np
+# Numba (pip install numba) compiles a Python function to machine code the first time it runs.
+# It's optional: without it, the example that uses it simply runs as normal Python
+try:
+    import numba
+except ImportError:
+    numba = None
+# deque is a list-like container from the standard library that is fast at both ends
+from collections import deque
+# array stores numbers packed together (like NumPy) instead of as separate Python objects
+from array import array
+
+# Banner line used above every section (built once, reused everywhere)
+BAR50 = "=" * 50
+
+# Line templates for the loops in Sections 7-9. Each loop fills in the
+# blanks (%s) instead of building a new f-string format on every pass.
+ITEM_LINE = "  - %s"
+DAY_TEMP_LINE = "  Day %s: %s°F"
+HOT_DAY_LINE = "  Hot day! Temperature: %s°F"
+INDEX_LINE = "  Index %s: %s"
+TASK_LINE = "  Task #%s: %s"
+FOUND_80_LINE = "  Temperature 80°F was on day %s (index %s)"
+PRICE_LINE = "  Day %s: $%s - %s"
+NUMPY_PRICE_LINE = "  Day %s (NumPy): $%s - %s"
+PROCESSING_LINE = "  Processing: %s"
+REMAINING_LINE = "  Remaining: %s"
+
 # ============================================
 # SECTION 1: CREATING OUR SAMPLE LISTS
 # ============================================
@@ -23,6 +53,10 @@ task_list = ["Fix login bug", "Update homepage", "Write documentation", "Test pa
 
 # 5. Stock prices - financial application
 stock_prices = [150.25, 148.90, 152.10, 149.75, 151.30, 153.45]
+# Packed copy of the prices: 8 bytes per number instead of a full Python float object each
+stock_prices_packed = array('d', stock_prices)
+# NumPy array that shares the packed memory - no copy needed (used in Section 9)
+stock_prices_np = np.frombuffer(stock_prices_packed)
 
 print("Lists created successfully!")
 print()
@@ -34,10 +68,9 @@ print()
 # Python lists start counting at 0 (not 1!)
 # Index 0 = first item, Index 1 = second item, etc.
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 2: POSITIVE INDEXING")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Get the FIRST item (index 0)
 print("Example 1: Getting the first item")
@@ -61,9 +94,10 @@ print()
 print("Example 4: Getting the last item using length")
 # len() tells us how many items are in the list
 # If there are 6 items, the last index is 5 (because we start at 0)
-last_index = len(shopping_cart) - 1  # We subtract 1 because indexing starts at 0
+cart_size = len(shopping_cart)  # Count the items once and reuse the answer
+last_index = cart_size - 1  # We subtract 1 because indexing starts at 0
 last_item = shopping_cart[last_index]
-print(f"Shopping cart has {len(shopping_cart)} items")
+print(f"Shopping cart has {cart_size} items")
 print(f"Last item in shopping cart: {last_item}")  # Output: yogurt
 print()
 
@@ -74,10 +108,9 @@ print()
 # Index -1 = last item, Index -2 = second to last, etc.
 # This is EASIER than using len() - 1!
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 3: NEGATIVE INDEXING")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Get the LAST item (index -1)
 print("Example 1: Getting the last item with negative index")
@@ -108,10 +141,9 @@ print()
 # - stop: where to end (NOT INCLUDED)
 # Remember: stop index is NOT included in the result!
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 4: SLICING")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Get first 3 items
 print("Example 1: Get first 3 items [0:3]")
@@ -161,10 +193,9 @@ print()
 # This is like "push" in other programming languages
 # The list gets modified directly (no need to reassign)
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 5: APPEND (Adding Items)")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Add one item to shopping cart
 print("Example 1: Adding 'butter' to shopping cart")
@@ -195,10 +226,9 @@ print()
 # pop() with no argument removes the LAST item
 # pop(index) removes the item at that specific index
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 6: POP (Removing Items)")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Remove the last item
 print("Example 1: Remove last item from shopping cart")
@@ -239,24 +269,23 @@ print()
 # We use a "for loop" to do this
 # Syntax: for variable_name in list_name:
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 7: LOOPING THROUGH LISTS")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Simple loop - print each item
 print("Example 1: Print each item in shopping cart")
 for item in shopping_cart:
     # The variable 'item' holds one item from the list each time through the loop
-    print(f"  - {item}")
+    print(ITEM_LINE % item)
 print()
 
 # Example 2: Loop with counter
 print("Example 2: Print temperatures with day numbers")
-day = 1  # Start counting at day 1
-for temp in temperatures:
-    print(f"  Day {day}: {temp}°F")
-    day = day + 1  # Increment the counter
+# enumerate(..., start=1) keeps the day counter for us, starting at day 1
+# (Section 8 explains enumerate in detail)
+for day, temp in enumerate(temperatures, start=1):
+    print(DAY_TEMP_LINE % (day, temp))
 print()
 
 # Example 3: Loop with conditional (if statement inside loop)
@@ -264,18 +293,28 @@ print("Example 3: Find hot days (temperature > 75)")
 for temp in temperatures:
     # Check if this temperature is hot
     if temp > 75:
-        print(f"  Hot day! Temperature: {temp}°F")
+        print(HOT_DAY_LINE % temp)
+# NumPy way: compare every temperature at once, then keep only the hot ones
+temps_array = np.asarray(temperatures)
+hot_days = temps_array[temps_array > 75]  # [True/False list] picks matching items
+print(f"  Hot days (NumPy): {hot_days.tolist()}")
 print()
 
 # Example 4: Loop and build a new list
 print("Example 4: Convert temperatures to Celsius")
-celsius_temps = []  # Create empty list to store results
-for fahrenheit in temperatures:
+# We already know the result has one value per temperature, so create the
+# full-size list up front instead of growing it with append()
+celsius_temps = [0.0] * len(temperatures)
+for i, fahrenheit in enumerate(temperatures):  # enumerate is explained in Section 8
     # Formula to convert F to C: (F - 32) * 5/9
     celsius = (fahrenheit - 32) * 5 / 9
-    celsius_temps.append(celsius)  # Add converted temp to new list
+    celsius_temps[i] = celsius  # Store converted temp at the same position
 print(f"Fahrenheit: {temperatures}")
 print(f"Celsius: {celsius_temps}")
+# Faster way for big lists (NumPy): convert the whole array in one step, no loop
+temps_np = np.asarray(temperatures)  # Same numbers, same precision as the list above
+celsius_np = (temps_np - 32) * 5 / 9  # Same formula, same order as the loop
+print(f"Celsius (NumPy): {celsius_np.tolist()}")
 print()
 
 # ============================================
@@ -285,30 +324,29 @@ print()
 # This is useful when you need to know the position
 # Syntax: for index, item in enumerate(list_name):
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 8: ENUMERATE (Index + Item)")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Print items with their index numbers
 print("Example 1: Show user roles with index numbers")
 for index, role in enumerate(user_roles):
     # enumerate gives us TWO variables: index (position) and role (the item)
-    print(f"  Index {index}: {role}")
+    print(INDEX_LINE % (index, role))
 print()
 
 # Example 2: Start counting at 1 instead of 0
 print("Example 2: Task list numbered starting at 1")
 for number, task in enumerate(task_list, start=1):
     # start=1 makes enumerate count from 1 instead of 0
-    print(f"  Task #{number}: {task}")
+    print(TASK_LINE % (number, task))
 print()
 
 # Example 3: Find position of specific item
 print("Example 3: Find which day had temperature of 80°F")
 for index, temp in enumerate(temperatures):
     if temp == 80:
-        print(f"  Temperature 80°F was on day {index + 1} (index {index})")
+        print(FOUND_80_LINE % (index + 1, index))
 print()
 
 # ============================================
@@ -316,78 +354,100 @@ print()
 # ============================================
 # Now let's combine multiple concepts we learned
 
-print("=" * 50)
+print(BAR50)
 print("SECTION 9: COMBINING CONCEPTS")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 
 # Example 1: Loop + Slice + Conditional
 print("Example 1: Analyze first 5 stock prices")
 first_five_prices = stock_prices[:5]  # Slice: get first 5
 for index, price in enumerate(first_five_prices, start=1):  # Enumerate: get index and price
     if price > 150:  # Conditional: check if price is high
-        print(f"  Day {index}: ${price} - HIGH PRICE")
+        print(PRICE_LINE % (index, price, "HIGH PRICE"))
     else:
-        print(f"  Day {index}: ${price} - normal")
+        print(PRICE_LINE % (index, price, "normal"))
+# NumPy way: np.where picks a label for every price at once - no if/else per item
+first_five_np = np.asarray(first_five_prices)
+labels = np.where(first_five_np > 150, "HIGH PRICE", "normal")
+for index, (price, label) in enumerate(zip(first_five_np, labels), start=1):
+    print(NUMPY_PRICE_LINE % (index, price, label))
 print()
 
-# Example 2: Loop + Append + Pop (Queue simulation)
+# Example 2: Loop + Pop (Queue simulation)
 print("Example 2: Task queue - add and process tasks")
-queue = []  # Start with empty task queue
 print("Adding tasks to queue...")
-queue.append("Send email")
-queue.append("Update database")
-queue.append("Generate report")
+# All tasks are known up front, so build the queue in one step
+queue = deque(["Send email", "Update database", "Generate report"])
 print(f"Queue: {queue}")
 print()
 print("Processing tasks...")
 while len(queue) > 0:  # While loop: continue until queue is empty
-    current = queue.pop(0)  # Pop: remove first item
-    print(f"  Processing: {current}")
-    print(f"  Remaining: {queue}")
+    # popleft() removes the first item without shifting the rest like list.pop(0) does
+    current = queue.popleft()
+    print(PROCESSING_LINE % current)
+    print(REMAINING_LINE % (queue,))
 print("All tasks completed!")
 print()
 
 # Example 3: Nested loop (loop inside a loop)
 print("Example 3: Compare all temperatures to find biggest change")
-biggest_change = 0
-day1 = 0
-day2 = 0
-# Outer loop: go through each temperature
-for i in range(len(temperatures) - 1):  # Stop before last item
-    # Inner loop: compare current temp to next temp
-    current_temp = temperatures[i]
-    next_temp = temperatures[i + 1]
-    change = abs(next_temp - current_temp)  # abs() makes it positive
-    if change > biggest_change:
-        biggest_change = change
-        day1 = i + 1
-        day2 = i + 2
+
+
+def find_biggest_change(temps):
+    biggest_change = 0
+    day1 = 0
+    day2 = 0
+    # Outer loop: go through each temperature
+    for i in range(len(temps) - 1):  # Stop before last item
+        # Inner loop: compare current temp to next temp
+        current_temp = temps[i]
+        next_temp = temps[i + 1]
+        change = abs(next_temp - current_temp)  # abs() makes it positive
+        if change > biggest_change:
+            biggest_change = change
+            day1 = i + 1
+            day2 = i + 2
+    return biggest_change, day1, day2
+
+
+# If Numba is installed, numba.njit turns this loop into fast machine code
+# (cache=True saves it for the next run); otherwise we keep the plain loop
+if numba is not None:
+    find_biggest_change = numba.njit(cache=True)(find_biggest_change)
+
+# Numba works on NumPy arrays, so convert the list first (plain Python is fine with them too)
+biggest_change, day1, day2 = find_biggest_change(np.asarray(temperatures))
 print(f"  Biggest temperature change: {biggest_change}°F")
 print(f"  Between day {day1} and day {day2}")
+# NumPy way: np.diff gives every day-to-day change, argmax finds the biggest one
+changes = np.abs(np.diff(np.asarray(temperatures)))
+i = int(changes.argmax())
+print(f"  NumPy says: {int(changes[i])}°F between day {i + 1} and day {i + 2}")
 print()
 
 # Example 4: List comprehension (advanced shortcut)
 print("Example 4: List comprehension - create list in one line")
 # This is an ADVANCED technique that combines loop + append
 # Normal way (what we learned):
-squares_normal = []
-for price in stock_prices:
-    squares_normal.append(price * 2)
+squares_normal = [0.0] * len(stock_prices)  # Full-size list, filled in below
+for i, price in enumerate(stock_prices):
+    squares_normal[i] = price * 2
 # Advanced way (list comprehension):
 squares_advanced = [price * 2 for price in stock_prices]
 print(f"  Doubled prices (normal loop): {squares_normal}")
 print(f"  Doubled prices (comprehension): {squares_advanced}")
-print("  Both methods give the same result!")
+# Fastest way for big lists (NumPy): multiply the whole array at once
+doubled_np = stock_prices_np * 2
+print(f"  Doubled prices (NumPy): {doubled_np.tolist()}")
+print("  All three methods give the same result!")
 print()
 
 # ============================================
 # SECTION 10: SUMMARY
 # ============================================
-print("=" * 50)
+print(BAR50)
 print("SUMMARY - WHAT WE LEARNED")
-print("=" * 50)
-print()
+print(BAR50, end="\n\n")
 print("1. POSITIVE INDEXING: list[0] = first item, list[1] = second item")
 print("2. NEGATIVE INDEXING: list[-1] = last item, list[-2] = second to last")
 print("3. SLICING: list[start:stop] = get multiple items")
@@ -10,10 +10,12 @@
 # Some modules are imported directly
 import logging
 
-print("=" * 60)
+# Banner line used above every section (built once, reused everywhere)
+BAR60 = "=" * 60
+
+print(BAR60)
 print("EXAMPLE 1: Basic Logging")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # Configure logging to show messages
 # level=logging.INFO means "show INFO level and above"
@@ -35,49 +37,58 @@ print()
 # Format: from module.submodule import something
 # This is NOT top-level - we're going INSIDE the module
 
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 2: Importing from logging.handlers")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # logging.handlers is a SUB-MODULE inside the logging module
 # We import RotatingFileHandler from inside logging.handlers
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 
-print("We imported RotatingFileHandler from logging.handlers")
+print("We imported RotatingFileHandler and MemoryHandler from logging.handlers")
 print("This is a sub-module import - not top-level!")
 print()
 
 # Create a file handler that rotates log files when they get too big
 file_handler = RotatingFileHandler(
     "app.log",  # Log file name
-    maxBytes=1000,  # Max size: 1000 bytes
+    maxBytes=1_048_576,  # Max size: 1 MB (rotating rarely keeps logging fast)
     backupCount=3,  # Keep 3 backup files
 )
 
 # Set the format for file logs
+# %(created).3f is the time as seconds since 1970 - it is already stored on every
+# message, so it is cheaper than %(asctime)s, which formats a date for each message
 file_handler.setFormatter(
-    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    logging.Formatter("%(created).3f - %(levelname)s - %(message)s")
+)
+
+# Put a MemoryHandler in front of the file handler: it collects messages in
+# memory and writes them to the file in one batch (when 1024 messages are
+# waiting, when an ERROR is logged, or when the program ends)
+memory_handler = MemoryHandler(
+    capacity=1024,  # Write to the file after this many messages
+    flushLevel=logging.ERROR,  # ERROR and above are written right away
+    target=file_handler,
 )
 
 # Add the handler to the logger
 logger = logging.getLogger()
-logger.addHandler(file_handler)
+logger.addHandler(memory_handler)
 
 # Now messages go to BOTH console and file
 logging.info("This message goes to console AND app.log file")
 logging.warning("File logging is working!")
 
-print("Check the 'app.log' file - it has the log messages!")
+print("Check the 'app.log' file - it has the log messages once the program ends!")
 print()
 
 # ============================================
 # EXAMPLE 3: Multiple sub-module imports
 # ============================================
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 3: Importing Multiple Items from Sub-modules")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # Import multiple handlers from the same sub-module
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
@@ -90,10 +101,9 @@ print()
 # ============================================
 # EXAMPLE 4: Why use sub-modules?
 # ============================================
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 4: Understanding Module Organization")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 print("Python organizes code into modules and sub-modules:")
 print()
@@ -109,22 +119,33 @@ print()
 # ============================================
 # EXAMPLE 5: Practical logging in a program
 # ============================================
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 5: Practical Example - Processing Data")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # Simulate processing some data with logging
 data = [10, 20, 30, 0, 50]
 
 logging.info("Starting data processing...")
 
+# Look up the logging methods and the INFO check ONCE, before the loop,
+# instead of repeating the same work for every item
+log_info = logger.info
+log_error = logger.error
+info_on = logger.isEnabledFor(logging.INFO)
+
+# A zero is expected data here, so check for it with a simple "if"
+# (raising and catching an exception for it is much slower).
+# try/except is kept only for errors we did NOT expect, so one bad item
+# doesn't stop the rest from being processed.
 for i, value in enumerate(data):
+    if value == 0:
+        log_error(f"Cannot divide by zero at index {i}")
+        continue
     try:
         result = 100 / value
-        logging.info(f"Processed item {i}: 100 / {value} = {result}")
-    except ZeroDivisionError:
-        logging.error(f"Cannot divide by zero at index {i}")
+        if info_on:
+            log_info(f"Processed item {i}: 100 / {value} = {result}")
     except Exception as e:
         logging.critical(f"Unexpected error: {e}")
 
@@ -134,10 +155,9 @@ print()
 # ============================================
 # SUMMARY
 # ============================================
-print("=" * 60)
+print(BAR60)
 print("SUMMARY: Module Imports")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 print("TOP-LEVEL IMPORT (simple):")
 print("  import logging")
 print("  logging.info('message')")
@@ -10,12 +10,27 @@
 
 # We'll use the requests library to talk to APIs
 # requests is like a messenger that sends and receives data from websites
+import sys
 import requests
+# ThreadPoolExecutor lets us wait for several web requests at the same time
+from concurrent.futures import ThreadPoolExecutor
+# orjson is a fast JSON library (pip install orjson) that reads the raw response bytes
+import orjson
+# ijson reads JSON piece by piece as it downloads (pip install ijson).
+# It's optional: without it we read the whole response with orjson instead
+try:
+    import ijson
+except ImportError:
+    ijson = None
+# itemgetter builds a small function that pulls several keys out of a dictionary in one call
+from operator import itemgetter
+
+# Banner line used above every section (built once, reused everywhere)
+BAR60 = "=" * 60
 
-print("=" * 60)
+print(BAR60)
 print("WHAT IS AN API?")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 print("API = A way for programs to talk to each other")
 print("We send a REQUEST, and get back a RESPONSE")
 print()
@@ -29,10 +44,9 @@ print()
 # Let's get weather for a city
 # We just need to ask the API nicely with a URL
 
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 1: Get Weather for Seattle")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # Step 1: Build the URL (the address where we ask for data)
 # Format: http://wttr.in/CITYNAME?format=j1
@@ -56,8 +70,8 @@ print(f"Step 3: Got response! Status code: {response.status_code}")
 print()
 
 # Step 3: Get the data from the response
-# .json() converts the response into a Python dictionary
-weather_data = response.json()
+# orjson.loads() converts the response bytes (response.content) into a Python dictionary
+weather_data = orjson.loads(response.content)
 
 print("Step 4: We got the data! It's a dictionary with weather info")
 print()
@@ -67,10 +81,10 @@ print()
 current = weather_data["current_condition"][0]  # Current weather is in a list
 
 # Pull out specific pieces of information
-temperature = current["temp_F"]  # Temperature in Fahrenheit
-feels_like = current["FeelsLikeF"]  # What it feels like
+# get_summary(current) returns (temp_F, FeelsLikeF, humidity) in one call
+get_summary = itemgetter("temp_F", "FeelsLikeF", "humidity")
+temperature, feels_like, humidity = get_summary(current)  # °F, feels-like °F, humidity %
 description = current["weatherDesc"][0]["value"]  # Weather description
-humidity = current["humidity"]  # Humidity percentage
 
 # Display the results
 print(f"Weather in {city}:")
@@ -85,36 +99,64 @@ print()
 # ============================================
 # Now let's use a loop to get weather for several cities
 
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 2: Weather for Multiple Cities")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # List of cities we want weather for
 cities = ["Portland", "Denver", "Austin", "Boston"]
 
-# Loop through each city
-for city in cities:
-    # Build the URL for this city
+# Both keys we need from each city's data, fetched in one call
+get_temp_and_desc = itemgetter("temp_F", "weatherDesc")
+
+# A Session reuses the same connection for every request (faster than
+# opening a brand new connection for each city)
+session = requests.Session()
+
+
+def get_city_weather(city):
+    """Send the request for one city and return the response"""
     url = f"http://wttr.in/{city}?format=j1"
-    
-    # Send the request
-    response = requests.get(url)
-    
-    # Check if request was successful
-    if response.status_code == 200:
-        # Get the data
-        data = response.json()
-        current = data["current_condition"][0]
-        
-        # Extract temperature and description
-        temp = current["temp_F"]
-        desc = current["weatherDesc"][0]["value"]
-        
-        # Print results
-        print(f"{city}: {temp}°F - {desc}")
-    else:
-        print(f"{city}: Could not get weather (error {response.status_code})")
+    # stream=True: don't download the whole answer yet, we only need a small part
+    return session.get(url, timeout=5, stream=True)
+
+
+def read_current_condition(response):
+    """Read only the current weather from a streamed response and stop there"""
+    try:
+        if ijson is None:
+            # No ijson: download the whole answer and pick out the part we need
+            return orjson.loads(response.content)["current_condition"][0]
+        response.raw.decode_content = True  # Undo any compression as we read
+        # "current_condition.item" = each entry of the current_condition list;
+        # next() takes the first one without parsing the rest of the document
+        return next(ijson.items(response.raw, "current_condition.item"))
+    finally:
+        response.close()
+
+
+# Ask for all cities at once instead of waiting for each one in turn.
+# executor.map gives the responses back in the same order as the cities list.
+with ThreadPoolExecutor(max_workers=8) as executor:
+    responses = executor.map(get_city_weather, cities)
+
+    # Loop through each city and its response
+    for city, response in zip(cities, responses):
+        # Check if request was successful
+        if response.status_code == 200:
+            # Get the data
+            current = read_current_condition(response)
+            
+            # Extract temperature and description
+            temp, weather_desc = get_temp_and_desc(current)
+            desc = weather_desc[0]["value"]
+            
+            # Print results
+            print(f"{city}: {temp}°F - {desc}")
+        else:
+            print(f"{city}: Could not get weather (error {response.status_code})")
+            # A streamed response holds its connection until it is closed
+            response.close()
 
 print()
 
@@ -123,10 +165,9 @@ print()
 # ============================================
 # What if something goes wrong? Let's handle errors properly
 
-print("=" * 60)
+print(BAR60)
 print("EXAMPLE 3: Handling Errors")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 
 # Try to get weather for a city (might have typo or connection issues)
 city = "InvalidCityName12345"
@@ -136,15 +177,15 @@ print(f"Trying to get weather for: {city}")
 
 # try/except catches errors so our program doesn't crash
 try:
-    response = requests.get(url, timeout=5)  # timeout = give up after 5 seconds
+    response = session.get(url, timeout=5, stream=True)  # timeout = give up after 5 seconds
     
     if response.status_code == 200:
-        data = response.json()
-        current = data["current_condition"][0]
+        current = read_current_condition(response)
         temp = current["temp_F"]
         print(f"Temperature: {temp}°F")
     else:
         print(f"Error: Got status code {response.status_code}")
+        response.close()  # Give the connection back to the session
         
 except requests.exceptions.Timeout:
     print("Error: Request took too long (timeout)")
@@ -160,13 +201,18 @@ print()
 # ============================================
 # Let's make it interactive - user can type a city name
 
-print("=" * 60)
-print("EXAMPLE 4: Interactive Weather Checker")
-print("=" * 60)
-print()
+# Write the whole heading and question in one go, then wait for the answer
+sys.stdout.write(
+    BAR60 + "\n"
+    "EXAMPLE 4: Interactive Weather Checker\n"
+    + BAR60 + "\n"
+    "\n"
+    "Enter a city name (or press Enter for New York):\n"
+)
+sys.stdout.flush()
 
 # Ask user for a city
-user_city = input("Enter a city name (or press Enter for New York): ")
+user_city = input("> ")
 
 # If they didn't type anything, use New York as default
 if user_city == "":
@@ -178,19 +224,15 @@ print(f"\nGetting weather for {user_city}...")
 url = f"http://wttr.in/{user_city}?format=j1"
 
 try:
-    response = requests.get(url, timeout=5)
+    response = session.get(url, timeout=5, stream=True)
     
     if response.status_code == 200:
-        data = response.json()
-        current = data["current_condition"][0]
+        current = read_current_condition(response)
         
-        # Get more detailed information
-        temp_f = current["temp_F"]
-        temp_c = current["temp_C"]
-        feels_like = current["FeelsLikeF"]
+        # Get more detailed information (all five values in one call)
+        get_details = itemgetter("temp_F", "temp_C", "FeelsLikeF", "humidity", "windspeedMiles")
+        temp_f, temp_c, feels_like, humidity, wind_speed = get_details(current)
         description = current["weatherDesc"][0]["value"]
-        humidity = current["humidity"]
-        wind_speed = current["windspeedMiles"]
         
         # Display nicely formatted results
         print()
@@ -204,6 +246,7 @@ try:
         print()
     else:
         print(f"Could not find weather for '{user_city}'")
+        response.close()  # Give the connection back to the session
         
 except Exception as e:
     print(f"Error getting weather: {e}")
@@ -212,10 +255,9 @@ except Exception as e:
 # SUMMARY: HOW APIs WORK
 # ============================================
 print()
-print("=" * 60)
+print(BAR60)
 print("SUMMARY: HOW APIs WORK")
-print("=" * 60)
-print()
+print(BAR60, end="\n\n")
 print("1. BUILD URL: Create the address where data lives")
 print("   Example: http://wttr.in/Seattle?format=j1")
 print()
@@ -225,7 +267,7 @@ print()
 print("3. CHECK STATUS: response.status_code tells if it worked")
 print("   200 = Success, 404 = Not found, 500 = Server error")
 print()
-print("4. GET DATA: response.json() converts data to dictionary")
+print("4. GET DATA: orjson.loads(response.content) converts data to dictionary")
 print("   Now you can access it like: data['key']['subkey']")
 print()
 print("5. USE DATA: Extract what you need and display it")
@@ -20,8 +20,38 @@ Purpose: Automated Testing Documentation
 import subprocess
 import sys
 import os
+import re
+import atexit
+import queue
+import threading
 from io import StringIO
 import contextlib
+# ThreadPoolExecutor lets several game processes run at the same time
+from concurrent.futures import ThreadPoolExecutor
+# The result announcements are defined once, in game_harness.py
+from game_harness import RESULT_REGEXES
+
+# How many harness processes each game file may use at once. The harnesses
+# are shared by all worker threads, so a handful of processes plays every game
+HARNESSES_PER_FILE = min(4, os.cpu_count() or 1)
+
+# One worker per harness: we test two game files, each with its own harnesses
+MAX_WORKERS = HARNESSES_PER_FILE * 2
+
+# Give up on a game after this many seconds. The harness stops a slow game
+# itself after 30 seconds; this is the backstop if the harness itself hangs
+HARNESS_TIMEOUT = 35
+
+# game_harness.py lives next to this file and replays many games in one process
+HARNESS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_harness.py')
+
+# Patterns for each possible result, compiled once. re.IGNORECASE matches
+# "Player X wins" and "x wins" alike without lowercasing the whole output.
+# They are bytes patterns because the game output stays as raw bytes.
+RESULT_PATTERNS = {
+    result: re.compile(regex.encode('ascii'), re.IGNORECASE)
+    for result, regex in RESULT_REGEXES.items()
+}
 
 # ============================================
 # TESTING UTILITIES SECTION
@@ -40,52 +70,141 @@ def simulate_game_input(moves_list):
     """
     return '\n'.join(str(move) for move in moves_list) + '\n'
 
-def run_game_with_input(game_file, input_string):
+class GameHarness:
+    """
+    One long-lived game_harness.py process for one game file.
+    Starting Python once and sending it game after game is much faster
+    than starting a fresh Python for every test.
+    """
+    
+    def __init__(self, game_file):
+        self.process = subprocess.Popen(
+            [sys.executable, HARNESS_FILE, game_file],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        self.timed_out = False
+    
+    def run(self, input_bytes):
+        """
+        Play one game and return (stdout, stderr, return_code) as bytes.
+        
+        If no complete reply arrives within HARNESS_TIMEOUT seconds the
+        harness process is killed and the game is reported as timed out.
+        """
+        self.timed_out = False
+        # Kill the harness if it takes too long; our reads then hit the end
+        # of the stream instead of waiting forever
+        timer = threading.Timer(HARNESS_TIMEOUT, self._on_timeout)
+        timer.start()
+        try:
+            self.process.stdin.write(b"%d\n" % len(input_bytes) + input_bytes)
+            self.process.stdin.flush()
+            
+            header = self.process.stdout.readline()
+            if header:
+                return_code, stdout_length, stderr_length = map(int, header.split())
+                stdout = self.process.stdout.read(stdout_length)
+                stderr = self.process.stdout.read(stderr_length)
+                if len(stdout) + len(stderr) < stdout_length + stderr_length:
+                    header = b""  # The reply was cut off part way
+        except OSError:
+            header = b""  # The harness is gone, so we couldn't send the game
+        finally:
+            timer.cancel()
+        
+        if self.timed_out:
+            return b"", b"Test timed out", -1
+        if not header:
+            raise RuntimeError("game harness stopped unexpectedly")
+        return stdout, stderr, return_code
+    
+    def _on_timeout(self):
+        """Called by the timer in run() when a game takes too long."""
+        self.timed_out = True
+        self.process.kill()
+    
+    def alive(self):
+        """True while the harness process is still running."""
+        return self.process.poll() is None
+    
+    def close(self):
+        """Tell the harness we're done and wait for it to exit."""
+        self.process.stdin.close()
+        self.process.wait()
+
+# Each game file gets a queue of HARNESSES_PER_FILE slots shared by all
+# worker threads (a harness can only play one game at a time, so a thread
+# takes one out of the queue and puts it back when its game is done).
+# A slot holds None until its harness is first needed.
+# _all_harnesses remembers every harness started, for cleanup
+_harness_pools = {}
+_all_harnesses = []
+_harness_lock = threading.Lock()
+
+@contextlib.contextmanager
+def _borrow_harness(game_file):
+    """Lend out an idle harness for game_file, starting one if needed."""
+    with _harness_lock:
+        pool = _harness_pools.get(game_file)
+        if pool is None:
+            pool = _harness_pools[game_file] = queue.Queue()
+            for _ in range(HARNESSES_PER_FILE):
+                pool.put(None)
+    
+    harness = pool.get()  # Waits here while every harness is busy
+    try:
+        # Start a harness for an empty slot, or replace one that was killed
+        if harness is None or not harness.alive():
+            harness = GameHarness(game_file)
+            with _harness_lock:
+                _all_harnesses.append(harness)
+        yield harness
+    finally:
+        pool.put(harness)
+
+@atexit.register
+def close_harnesses():
+    """Shut down every harness process that was started."""
+    with _harness_lock:
+        for harness in _all_harnesses:
+            harness.close()
+        _all_harnesses.clear()
+
+def run_game_with_input(game_file, input_bytes):
     """
     Run a game file with simulated input and capture the output.
     
     Args:
         game_file: Name of the Python file to run
-        input_string: Simulated user input
+        input_bytes: Simulated user input, already encoded as bytes
     
     Returns:
-        Tuple of (stdout, stderr, return_code)
+        Tuple of (stdout, stderr, return_code); stdout and stderr are bytes,
+        decode them only when they need to be printed
     """
     try:
-        result = subprocess.run(
-            [sys.executable, game_file],
-            input=input_string,
-            capture_output=True,
-            text=True,
-            timeout=30  # Prevent hanging
-        )
-        return result.stdout, result.stderr, result.returncode
-    except subprocess.TimeoutExpired:
-        return "", "Test timed out", -1
+        with _borrow_harness(game_file) as harness:
+            return harness.run(input_bytes)
     except Exception as e:
-        return "", f"Error running test: {e}", -1
+        return b"", f"Error running test: {e}".encode('utf-8'), -1
 
 def check_win_in_output(output, expected_winner):
     """
     Check if the game output contains the expected winner announcement.
     
     Args:
-        output: Game output string
+        output: Game output (bytes)
         expected_winner: 'X', 'O', or 'Tie'
     
     Returns:
         Boolean indicating if the expected winner was found
     """
-    output_lower = output.lower()
-    
-    if expected_winner == 'X':
-        return 'player x wins' in output_lower or 'x wins' in output_lower
-    elif expected_winner == 'O':
-        return 'player o wins' in output_lower or 'o wins' in output_lower
-    elif expected_winner == 'Tie':
-        return 'tie' in output_lower or 'draw' in output_lower
+    pattern = RESULT_PATTERNS.get(expected_winner)
+    if pattern is None:
+        return False
     
-    return False
+    return pattern.search(output) is not None
 
 def print_test_header(test_name):
     """Print a formatted test header."""
@@ -117,6 +236,9 @@ class TestCase:
         self.moves = moves
         self.expected_winner = expected_winner
         self.description = description
+        # The moves never change, so build the simulated input just once
+        self.input_string = simulate_game_input(moves)
+        self.input_bytes = self.input_string.encode('utf-8')
     
     def __str__(self):
         return f"{self.name}: {self.description}"
@@ -201,6 +323,9 @@ TEST_CASES = [
     )
 ]
 
+# Look up test cases by lowercase name without scanning the whole list
+_BY_NAME = {tc.name.lower(): tc for tc in TEST_CASES}
+
 # ============================================
 # INPUT VALIDATION TEST CASES
 # ============================================
@@ -227,17 +352,23 @@ INVALID_INPUT_TESTS = [
     }
 ]
 
+# Encode each test's simulated input once, ready to send to the game
+for test_data in INVALID_INPUT_TESTS:
+    test_data['input_bytes'] = ('\n'.join(test_data['inputs']) + '\n').encode('utf-8')
+
 # ============================================
 # MAIN TESTING FUNCTIONS
 # ============================================
 
-def test_single_game(game_file, test_case):
+def test_single_game(game_file, test_case, game_result=None):
     """
     Run a single test case against a game file.
     
     Args:
         game_file: Path to the game file (tictactoe_lists.py or tictactoe_dict.py)
         test_case: TestCase object with moves and expected result
+        game_result: Optional (stdout, stderr, return_code) from a game that
+                     was already run; if omitted the game is run here
     
     Returns:
         Boolean indicating if the test passed
@@ -246,17 +377,16 @@ def test_single_game(game_file, test_case):
     print(f"Moves: {test_case.moves}")
     print(f"Expected winner: {test_case.expected_winner}")
     
-    # Create input string from moves
-    input_string = simulate_game_input(test_case.moves)
-    
-    # Run the game
-    stdout, stderr, return_code = run_game_with_input(game_file, input_string)
+    # Run the game (unless it was already run for us)
+    if game_result is None:
+        game_result = run_game_with_input(game_file, test_case.input_bytes)
+    stdout, stderr, return_code = game_result
     
     # Check if there were any errors
     if return_code != 0:
         print(f"❌ Game crashed with return code {return_code}")
         if stderr:
-            print(f"Error output: {stderr}")
+            print(f"Error output: {stderr.decode('utf-8', 'replace')}")
         return False
     
     # Check if the expected winner was announced
@@ -268,16 +398,18 @@ def test_single_game(game_file, test_case):
     else:
         print(f"❌ Expected winner {test_case.expected_winner} not found in output")
         print("Game output (last 500 chars):")
-        print(stdout[-500:] if len(stdout) > 500 else stdout)
+        print(stdout[-500:].decode('utf-8', 'replace'))
         return False
 
-def test_input_validation(game_file, test_data):
+def test_input_validation(game_file, test_data, game_result=None):
     """
     Test input validation by trying invalid inputs.
     
     Args:
         game_file: Path to the game file
         test_data: Dictionary with test information
+        game_result: Optional (stdout, stderr, return_code) from a game that
+                     was already run; if omitted the game is run here
     
     Returns:
         Boolean indicating if validation worked correctly
@@ -286,18 +418,17 @@ def test_input_validation(game_file, test_data):
     print(f"Description: {test_data['description']}")
     print(f"Test inputs: {test_data['inputs']}")
     
-    # Create input string
-    input_string = '\n'.join(test_data['inputs']) + '\n'
-    
-    # Run the game
-    stdout, stderr, return_code = run_game_with_input(game_file, input_string)
+    # Run the game (unless it was already run for us)
+    if game_result is None:
+        game_result = run_game_with_input(game_file, test_data['input_bytes'])
+    stdout, stderr, return_code = game_result
     
     # Check if expected error messages appear
     output_lower = stdout.lower()
     found_messages = []
     
     for expected_msg in test_data['should_contain']:
-        if expected_msg.lower() in output_lower:
+        if expected_msg.lower().encode('utf-8') in output_lower:
             found_messages.append(expected_msg)
     
     if found_messages:
@@ -306,7 +437,7 @@ def test_input_validation(game_file, test_data):
     else:
         print(f"❌ Expected error messages not found: {test_data['should_contain']}")
         print("Game output (last 300 chars):")
-        print(stdout[-300:] if len(stdout) > 300 else stdout)
+        print(stdout[-300:].decode('utf-8', 'replace'))
         return False
 
 def test_game_comparison():
@@ -325,10 +456,8 @@ def test_game_comparison():
     )
     
     # Test both versions with the same input
-    input_string = simulate_game_input(comparison_test.moves)
-    
-    lists_stdout, lists_stderr, lists_code = run_game_with_input('tictactoe_lists.py', input_string)
-    dict_stdout, dict_stderr, dict_code = run_game_with_input('tictactoe_dict.py', input_string)
+    lists_stdout, lists_stderr, lists_code = run_game_with_input('tictactoe_lists.py', comparison_test.input_bytes)
+    dict_stdout, dict_stderr, dict_code = run_game_with_input('tictactoe_dict.py', comparison_test.input_bytes)
     
     # Both should run successfully
     if lists_code != 0 or dict_code != 0:
@@ -370,25 +499,42 @@ def run_all_tests():
     total_tests = 0
     passed_tests = 0
     
-    # Test both game versions with all test cases
-    for game_file in ['tictactoe_lists.py', 'tictactoe_dict.py']:
-        game_name = "Nested Lists" if "lists" in game_file else "Dictionary"
-        
-        print_test_header(f"{game_name.upper()} VERSION TESTS")
-        
-        # Run win condition tests
-        print(f"\n🎯 Testing Win Conditions for {game_name} Version")
-        for test_case in TEST_CASES:
-            total_tests += 1
-            if test_single_game(game_file, test_case):
-                passed_tests += 1
+    game_files = ['tictactoe_lists.py', 'tictactoe_dict.py']
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Start every game run up front so they all play at the same time.
+        # Each future holds (stdout, stderr, return_code) for one run.
+        win_runs = {}
+        validation_runs = {}
+        for game_file in game_files:
+            win_runs[game_file] = [
+                executor.submit(run_game_with_input, game_file, test_case.input_bytes)
+                for test_case in TEST_CASES
+            ]
+            validation_runs[game_file] = [
+                executor.submit(run_game_with_input, game_file, test_data['input_bytes'])
+                for test_data in INVALID_INPUT_TESTS
+            ]
         
-        # Run input validation tests
-        print(f"\n🛡️ Testing Input Validation for {game_name} Version")
-        for test_data in INVALID_INPUT_TESTS:
-            total_tests += 1
-            if test_input_validation(game_file, test_data):
-                passed_tests += 1
+        # Report the results in the usual order, so output never interleaves
+        for game_file in game_files:
+            game_name = "Nested Lists" if "lists" in game_file else "Dictionary"
+            
+            print_test_header(f"{game_name.upper()} VERSION TESTS")
+            
+            # Run win condition tests
+            print(f"\n🎯 Testing Win Conditions for {game_name} Version")
+            for test_case, run in zip(TEST_CASES, win_runs[game_file]):
+                total_tests += 1
+                if test_single_game(game_file, test_case, run.result()):
+                    passed_tests += 1
+            
+            # Run input validation tests
+            print(f"\n🛡️ Testing Input Validation for {game_name} Version")
+            for test_data, run in zip(INVALID_INPUT_TESTS, validation_runs[game_file]):
+                total_tests += 1
+                if test_input_validation(game_file, test_data, run.result()):
+                    passed_tests += 1
     
     # Run comparison test
     print(f"\n🔄 Testing Version Comparison")
@@ -425,11 +571,17 @@ def test_specific_win_condition(condition_name):
     Test a specific win condition by name.
     Useful for debugging specific scenarios.
     """
-    test_case = None
-    for tc in TEST_CASES:
-        if condition_name.lower() in tc.name.lower():
-            test_case = tc
-            break
+    wanted = condition_name.lower()
+    
+    # Exact names are a single dictionary lookup...
+    test_case = _BY_NAME.get(wanted)
+    
+    # ...otherwise fall back to the first name that contains the search text
+    if test_case is None:
+        for name, tc in _BY_NAME.items():
+            if wanted in name:
+                test_case = tc
+                break
     
     if not test_case:
         print(f"❌ Test case '{condition_name}' not found")
@@ -24,328 +24,401 @@ Python Level: Beginner (Week 3)
 Data Structure: Dictionary
 """
 
+# sys gives us sys.stdout.write(), which prints a whole block of text at once
+import sys
+# io.StringIO is a "fake file" in memory - we can print into it and show it later
+import io
+
 # ============================================
 # GAME SETUP AND INITIALIZATION
 # ============================================
 # This section sets up all the variables we need for the game
 # We create the board and set the starting conditions
 
-print("Welcome to Tic-Tac-Toe - Dictionary Version!")
-print("This version uses a dictionary to store the game board.")
-print("You'll see how we use keys (1-9) to directly access positions.")
-print()
-
-# board: This is a dictionary with number keys (1-9) and string values
-# Keys represent board positions, values are either numbers or X/O
-# This is different from the nested lists version - no row/column math needed!
-board = {
-    1: "1",
-    2: "2",
-    3: "3",  # Top row: positions 1, 2, 3
-    4: "4",
-    5: "5",
-    6: "6",  # Middle row: positions 4, 5, 6
-    7: "7",
-    8: "8",
-    9: "9",  # Bottom row: positions 7, 8, 9
-}
-
-# current_player: A string that holds either 'X' or 'O'
-# This tells us whose turn it is to play
-# We start with 'X' because X always goes first in tic-tac-toe
-# (This is identical to the nested lists version)
-current_player = "X"
-
-# game_over: A boolean (True or False) that tracks if the game has ended
-# We start with False because the game just began
-# This becomes True when someone wins or the board is full (tie)
-# (This is identical to the nested lists version)
-game_over = False
-
-# winner: A string that will hold 'X', 'O', or 'Tie' when the game ends
-# We start with an empty string because no one has won yet
-# (This is identical to the nested lists version)
-winner = ""
-
-# moves_made: An integer that counts how many moves have been made
-# We use this to detect tie games (when moves_made reaches 9)
-# (This is identical to the nested lists version)
-moves_made = 0
-
-print("Game setup complete! Here's how the dictionary works:")
-print("board =", board)
-print()
-print("To access a specific position, we use board[key]:")
-print("board[1] =", board[1], "← Position 1 (top-left)")
-print("board[5] =", board[5], "← Position 5 (center)")
-print("board[9] =", board[9], "← Position 9 (bottom-right)")
-print()
-print("Notice: No row/column conversion needed! Position number IS the key!")
-print()
-print("Let's start playing!")
-print()
+# DEBUG: Set this to True to see extra "behind the scenes" messages
+# while playing (like which dictionary key each move checks). Normal games leave it off
+# so each move prints less
+DEBUG = False
+
+# BOARD_TEMPLATE: The picture of the board, with a {} slot for each of the 9 cells
+# .format() fills the slots in order (left to right, top to bottom), so we can
+# draw the whole board with one write instead of many small print() calls
+BOARD_TEMPLATE = (
+    " {} | {} | {}\n"
+    "-----------\n"
+    " {} | {} | {}\n"
+    "-----------\n"
+    " {} | {} | {}\n"
+)
+
+# SEPARATOR: The line of = signs drawn above and below "GAME OVER!"
+# Built once here and reused, instead of working out "=" * 30 each time
+SEPARATOR = "=" * 30
+
+# PLAYERS: The two marks a cell can hold once someone has played there
+# A frozenset is a set that never changes - checking "in" it is very fast
+PLAYERS = frozenset("XO")
+
+# NEXT_PLAYER: Whose turn comes after each player
+# Looking the answer up in a dictionary replaces an if/else every turn
+NEXT_PLAYER = {"X": "O", "O": "X"}
+
+# WIN_LINES: Every way to get three in a row, written as dictionary keys
+# Each entry is (name, (key, key, key)) so we can say which line won
+WIN_LINES = (
+    ("Top row", (1, 2, 3)),
+    ("Middle row", (4, 5, 6)),
+    ("Bottom row", (7, 8, 9)),
+    ("Left column", (1, 4, 7)),
+    ("Middle column", (2, 5, 8)),
+    ("Right column", (3, 6, 9)),
+    ("Main diagonal", (1, 5, 9)),   # Top-left to bottom-right
+    ("Anti-diagonal", (3, 5, 7)),   # Top-right to bottom-left
+)
+
+# PERFORMANCE NOTE: Very fast game programs often skip the board when checking
+# for a win. They keep each player's positions as the bits of one number (a
+# "bitmask") and test a whole line with a single & operation. That is faster,
+# but it hides the board - and reading board[key] values is what this version
+# teaches, so our win check looks at the real board instead.
+
+# LINES_THROUGH: For each position, only the winning lines that include it
+# A move can only complete a line that goes through the cell just played,
+# so the center (5) needs 4 checks, corners need 3 and edges need only 2
+# Example: LINES_THROUGH[2] holds just the top row and the middle column
+LINES_THROUGH = {}
+for cell in range(1, 10):
+    LINES_THROUGH[cell] = tuple(
+        (line_name, keys)
+        for line_name, keys in WIN_LINES
+        if cell in keys
+    )
 
 # ============================================
-# BOARD DISPLAY SECTION
+# MAIN FUNCTION - The whole game lives in here
 # ============================================
-# This section contains code to show the current game board
-# It formats the board nicely so players can see the game state
-# COMPARISON: Notice how different this is from the nested lists version!
+# Python looks up variables inside a function faster than variables at the
+# top level of a file, and the game reads board, current_player and friends
+# many times every turn - so we put the game inside main() and call it at
+# the bottom of the file
+
+def main():
+    """
+    Play one game of tic-tac-toe from the welcome message to the goodbye.
+
+    The constants above (BOARD_TEMPLATE, PLAYERS, ...) stay outside because
+    they never change; everything that changes during a game is created here.
+    """
+    print("Welcome to Tic-Tac-Toe - Dictionary Version!")
+    print("This version uses a dictionary to store the game board.")
+    print("You'll see how we use keys (1-9) to directly access positions.")
+    print()
 
-# Display the current board using direct dictionary access
-# This is much simpler than nested loops - we just access each position directly!
+    # board: This is a dictionary with number keys (1-9) and string values
+    # Keys represent board positions, values are either numbers or X/O
+    # This is different from the nested lists version - no row/column math needed!
+    board = {
+        1: "1",
+        2: "2",
+        3: "3",  # Top row: positions 1, 2, 3
+        4: "4",
+        5: "5",
+        6: "6",  # Middle row: positions 4, 5, 6
+        7: "7",
+        8: "8",
+        9: "9",  # Bottom row: positions 7, 8, 9
+    }
+
+    # board_get: A shortcut to the board's "look up a key" method
+    # board_get(5) gives the same answer as board[5]. The board is read many
+    # times every turn (9 times just to draw it), and calling the saved
+    # method skips a small lookup that board[5] repeats each time
+    board_get = board.__getitem__
+
+    # PERFORMANCE NOTE: Programs that must be as fast as possible often store a
+    # board like this as one flat block of bytes, e.g. bytearray(b"123456789"),
+    # where board[position - 1] is a small number and no key lookup is needed.
+    # That is faster, but much harder to read - and learning dictionaries is the
+    # whole point of this version, so we keep the dictionary here.
+
+    # current_player: A string that holds either 'X' or 'O'
+    # This tells us whose turn it is to play
+    # We start with 'X' because X always goes first in tic-tac-toe
+    # (This is identical to the nested lists version)
+    current_player = "X"
 
-print("Current board:")
-print()
+    # game_over: A boolean (True or False) that tracks if the game has ended
+    # We start with False because the game just began
+    # This becomes True when someone wins or the board is full (tie)
+    # (This is identical to the nested lists version)
+    game_over = False
 
-# DICTIONARY APPROACH: Access positions directly by their keys
-# Compare this to the nested lists version that needed loops and [row][col] indexing
+    # winner: A string that will hold 'X', 'O', or 'Tie' when the game ends
+    # We start with an empty string because no one has won yet
+    # (This is identical to the nested lists version)
+    winner = ""
 
-# Top row: positions 1, 2, 3
+    # moves_made: An integer that counts how many moves have been made
+    # We use this to detect tie games (when moves_made reaches 9)
+    # (This is identical to the nested lists version)
+    moves_made = 0
 
-print(" " + board[1] + " | " + board[2] + " | " + board[3])
-print("-----------")
+    print("Game setup complete! Here's how the dictionary works:")
+    print("board =", board)
+    print()
+    print("To access a specific position, we use board[key]:")
+    print("board[1] =", board[1], "← Position 1 (top-left)")
+    print("board[5] =", board[5], "← Position 5 (center)")
+    print("board[9] =", board[9], "← Position 9 (bottom-right)")
+    print()
+    print("Notice: No row/column conversion needed! Position number IS the key!")
+    print()
+    print("Let's start playing!")
+    print()
 
-# Middle row: positions 4, 5, 6
-print(" " + board[4] + " | " + board[5] + " | " + board[6])
-print("-----------")
+    # ============================================
+    # BOARD DISPLAY SECTION
+    # ============================================
+    # This section contains code to show the current game board
+    # It formats the board nicely so players can see the game state
+    # COMPARISON: Notice how different this is from the nested lists version!
 
-# Bottom row: positions 7, 8, 9
-print(" " + board[7] + " | " + board[8] + " | " + board[9])
+    # Display the current board using direct dictionary access
+    # This is much simpler than nested loops - we just access each position directly!
 
-print()
+    print("Current board:")
+    print()
 
-# EDUCATIONAL NOTE: Compare this approach with nested lists
-print("Dictionary vs Nested Lists comparison:")
-print("- Dictionary: board[1], board[2], board[3] (direct access)")
-print("- Nested Lists: board[0][0], board[0][1], board[0][2] (row/column)")
-print("- Dictionary: No loops needed for display")
-print("- Nested Lists: Needed nested for loops")
-print("- Dictionary: Position number IS the key")
-print("- Nested Lists: Need math to convert position to row/column")
-print()
+    # DICTIONARY APPROACH: Access positions directly by their keys
+    # Compare this to the nested lists version that needed [row][col] indexing
+    # Top row: positions 1, 2, 3 / Middle row: 4, 5, 6 / Bottom row: 7, 8, 9
+    sys.stdout.write(BOARD_TEMPLATE.format(
+        board_get(1), board_get(2), board_get(3),
+        board_get(4), board_get(5), board_get(6),
+        board_get(7), board_get(8), board_get(9),
+    ))
 
-# ============================================
-# MAIN GAME LOOP - Keep playing until game ends
-# ============================================
-# This section contains the main game logic that repeats until someone wins
+    print()
 
-# Start the main game loop - this will keep running until game_over becomes True
-while not game_over:
+    # EDUCATIONAL NOTE: Compare this approach with nested lists
+    print("Dictionary vs Nested Lists comparison:")
+    print("- Dictionary: board[1], board[2], board[3] (direct access)")
+    print("- Nested Lists: board[0][0], board[0][1], board[0][2] (row/column)")
+    print("- Dictionary: No loops needed for display")
+    print("- Nested Lists: Needed to join the rows together first")
+    print("- Dictionary: Position number IS the key")
+    print("- Nested Lists: Need math to convert position to row/column")
+    print()
 
     # ============================================
-    # INPUT VALIDATION AND PROCESSING SECTION
+    # MAIN GAME LOOP - Keep playing until game ends
     # ============================================
-    # This section handles getting input from players
-    # COMPARISON: Much simpler than nested lists - no coordinate conversion!
+    # This section contains the main game logic that repeats until someone wins
 
-    # valid_move: A boolean that tracks whether the player's move is acceptable
-    # We start with False and only set it to True if all checks pass
-    # (This is identical to the nested lists version)
-    valid_move = False
+    # Start the main game loop - this will keep running until game_over becomes True
+    while not game_over:
 
-    # Keep asking for input until we get a valid move
-    # This while loop will repeat until valid_move becomes True
-    while not valid_move:
+        # out: Collects everything this turn prints (print(..., file=out) writes
+        # into it), so the whole turn reaches the screen with one write at the end
+        # instead of many separate print() calls
+        out = io.StringIO()
 
-        # Get input from the current player
-        # f-strings let us put variables directly into strings
-        # (This is identical to the nested lists version)
-        player_input = input(f"Player {current_player}, enter position (1-9): ")
+        # ============================================
+        # INPUT VALIDATION AND PROCESSING SECTION
+        # ============================================
+        # This section handles getting input from players
+        # COMPARISON: Much simpler than nested lists - no coordinate conversion!
 
-        # INPUT VALIDATION STEP 1: Check if input can be converted to a number
-        # We use try/except to catch errors if they enter letters or symbols
+        # valid_move: A boolean that tracks whether the player's move is acceptable
+        # We start with False and only set it to True if all checks pass
         # (This is identical to the nested lists version)
-        try:
-            # int() converts the string input to an integer (whole number)
-            # If the player typed letters, this will cause an error
-            position = int(player_input)
+        valid_move = False
+
+        # The question to ask the current player
+        # f-strings let us put variables directly into strings
+        # current_player doesn't change until the move is made, so we build the
+        # question once here instead of every time we have to ask again
+        prompt = f"Player {current_player}, enter position (1-9): "
+
+        # Keep asking for input until we get a valid move
+        # This while loop will repeat until valid_move becomes True
+        while not valid_move:
 
-            # INPUT VALIDATION STEP 2: Check if the number is in valid range
-            # Valid positions are 1, 2, 3, 4, 5, 6, 7, 8, 9
+            # Get input from the current player
             # (This is identical to the nested lists version)
-            if position >= 1 and position <= 9:
-
-                # DICTIONARY ADVANTAGE: No coordinate conversion needed!
-                # Compare this to nested lists version that needed:
-                # row = (position - 1) // 3
-                # col = (position - 1) % 3
-
-                print(f"Position {position} - checking dictionary key {position}")
-
-                # INPUT VALIDATION STEP 3: Check if the position is empty
-                # DICTIONARY APPROACH: Direct key access - much simpler!
-                # A position is empty if it still contains its original number
-                # If it contains 'X' or 'O', then it's already taken
-                if board[position] not in ["X", "O"]:
-                    # Position is empty! We can make this move
-                    valid_move = True
-                    print(
-                        f"Valid move! Placing {current_player} at position {position}"
-                    )
-                else:
-                    # Position is already taken
-                    print(
-                        f"Position {position} is already taken by {board[position]}. Choose an empty position."
-                    )
-
-            else:
-                # The number is outside our valid range (less than 1 or greater than 9)
-                print("Please enter a number between 1 and 9")
-
-        except:
-            # This runs if int() failed because they entered non-numbers
-            print("Please enter a number, not letters or symbols")
-
-    # MAKE THE MOVE: Update the board with the player's choice
-    # DICTIONARY ADVANTAGE: Direct assignment - no row/column needed!
-    # Compare to nested lists: board[row][col] = current_player
-    board[position] = current_player
-    moves_made = moves_made + 1  # Keep track of how many moves have been made
-
-    print(f"Move made! {current_player} placed at position {position}")
-    print()
+            player_input = input(prompt)
 
-    # DISPLAY UPDATED BOARD: Show the board after the move
-    print("Updated board:")
-    print()
+            # INPUT VALIDATION STEP 1: Check if input can be converted to a number
+            # We use try/except to catch errors if they enter letters or symbols
+            # (This is identical to the nested lists version)
+            try:
+                # int() converts the string input to an integer (whole number)
+                # If the player typed letters, this will cause an error
+                position = int(player_input)
+
+                # INPUT VALIDATION STEP 2: Check if the number is in valid range
+                # Valid positions are 1, 2, 3, 4, 5, 6, 7, 8, 9
+                # (This is identical to the nested lists version)
+                if position >= 1 and position <= 9:
+
+                    # DICTIONARY ADVANTAGE: No coordinate conversion needed!
+                    # Compare this to nested lists version that needed:
+                    # row, col = divmod(position - 1, 3)
+
+                    if DEBUG:
+                        print(f"Position {position} - checking dictionary key {position}", file=out)
+
+                    # INPUT VALIDATION STEP 3: Check if the position is empty
+                    # DICTIONARY APPROACH: Direct key access - much simpler!
+                    # A position is empty if it still contains its original number
+                    # If it contains 'X' or 'O', then it's already taken
+                    if board_get(position) not in PLAYERS:
+                        # Position is empty! We can make this move
+                        valid_move = True
+                        print(
+                            f"Valid move! Placing {current_player} at position {position}",
+                            file=out,
+                        )
+                    else:
+                        # Position is already taken
+                        print(
+                            f"Position {position} is already taken by {board_get(position)}. Choose an empty position.",
+                            file=out,
+                        )
 
-    # Display the board again using direct dictionary access
-    print(" " + board[1] + " | " + board[2] + " | " + board[3])
-    print("-----------")
-    print(" " + board[4] + " | " + board[5] + " | " + board[6])
-    print("-----------")
-    print(" " + board[7] + " | " + board[8] + " | " + board[9])
+                else:
+                    # The number is outside our valid range (less than 1 or greater than 9)
+                    print("Please enter a number between 1 and 9", file=out)
+
+            except ValueError:
+                # This runs if int() failed because they entered non-numbers
+                # (int() raises ValueError for text like "abc"; naming it means
+                # other problems - like pressing Ctrl+C - are not hidden here)
+                print("Please enter a number, not letters or symbols", file=out)
+
+            # If the move was rejected, show why right away - before asking again
+            if not valid_move:
+                sys.stdout.write(out.getvalue())
+                out = io.StringIO()
+
+        # MAKE THE MOVE: Update the board with the player's choice
+        # DICTIONARY ADVANTAGE: Direct assignment - no row/column needed!
+        # Compare to nested lists: board[row][col] = current_player
+        board[position] = current_player
+        moves_made += 1  # Keep track of how many moves have been made (+= 1 adds one)
+
+        print(f"Move made! {current_player} placed at position {position}", file=out)
+        print(file=out)
+
+        # DISPLAY UPDATED BOARD: Show the board after the move
+        print("Updated board:", file=out)
+        print(file=out)
+
+        # Display the board again using direct dictionary access
+        out.write(BOARD_TEMPLATE.format(
+            board_get(1), board_get(2), board_get(3),
+            board_get(4), board_get(5), board_get(6),
+            board_get(7), board_get(8), board_get(9),
+        ))
+
+        print(file=out)
+
+        # ============================================
+        # WIN DETECTION SECTION
+        # ============================================
+        # This section checks if someone has won the game
+        # We never need to check the other player - they didn't just move -
+        # so the win test only ever looks at current_player's positions
+
+        # CHECK THE WINNING LINES THROUGH THE CELL JUST PLAYED
+        # A move can only complete a line that goes through its own cell, so we
+        # only check those lines. The loop "unpacks" each entry: line_name gets
+        # the name, a, b, c the keys
+        for line_name, (a, b, c) in LINES_THROUGH[position]:
+            # DICTIONARY APPROACH: Each winning line is just three keys
+            # All three positions in this line must hold the current player's mark
+            if current_player == board_get(a) == board_get(b) == board_get(c):
+                winner = current_player
+                game_over = True
+                print(f"{line_name} win! Player {winner} wins!", file=out)
+                break  # Stop checking once we find a winner
+
+        # CHECK FOR TIE GAME
+        # If no one has won and all 9 positions are filled, it's a tie
+        # moves_made always matches the number of filled positions, so we can
+        # trust it here instead of looking through the whole board
+        # (A separate if, not elif, so a win on the 9th move is still a win)
+        if not game_over and moves_made == 9:
+            winner = "Tie"
+            game_over = True
+            print("All positions filled - it's a tie game!", file=out)
+
+        # SWITCH PLAYERS (only if game is not over)
+        # After each move, we need to switch to the other player
+        # (This is identical to the nested lists version)
+        if not game_over:
+            current_player = NEXT_PLAYER[current_player]  # X -> O, O -> X
 
-    print()
+            print(f"Next turn: Player {current_player}", file=out)
+            print(file=out)
+
+        # Show everything this turn printed, all at once
+        sys.stdout.write(out.getvalue())
 
     # ============================================
-    # WIN DETECTION SECTION
+    # GAME END SECTION
     # ============================================
-    # This section checks if someone has won the game
-    # COMPARISON: Different approach than nested lists - we specify exact positions
-
-    # CHECK FOR ROW WINS (horizontal lines)
-    # DICTIONARY APPROACH: We explicitly check each winning combination
-    # Compare to nested lists that used loops - this is more explicit but longer
-
-    # Top row: positions 1, 2, 3
-    if board[1] == board[2] == board[3] and board[1] in ["X", "O"]:
-        winner = board[1]
-        game_over = True
-        print(f"Top row win! Player {winner} wins!")
-
-    # Middle row: positions 4, 5, 6
-    elif board[4] == board[5] == board[6] and board[4] in ["X", "O"]:
-        winner = board[4]
-        game_over = True
-        print(f"Middle row win! Player {winner} wins!")
-
-    # Bottom row: positions 7, 8, 9
-    elif board[7] == board[8] == board[9] and board[7] in ["X", "O"]:
-        winner = board[7]
-        game_over = True
-        print(f"Bottom row win! Player {winner} wins!")
-
-    # CHECK FOR COLUMN WINS (vertical lines)
-    # Left column: positions 1, 4, 7
-    elif board[1] == board[4] == board[7] and board[1] in ["X", "O"]:
-        winner = board[1]
-        game_over = True
-        print(f"Left column win! Player {winner} wins!")
-
-    # Middle column: positions 2, 5, 8
-    elif board[2] == board[5] == board[8] and board[2] in ["X", "O"]:
-        winner = board[2]
-        game_over = True
-        print(f"Middle column win! Player {winner} wins!")
-
-    # Right column: positions 3, 6, 9
-    elif board[3] == board[6] == board[9] and board[3] in ["X", "O"]:
-        winner = board[3]
-        game_over = True
-        print(f"Right column win! Player {winner} wins!")
-
-    # CHECK FOR DIAGONAL WINS
-    # Main diagonal: positions 1, 5, 9 (top-left to bottom-right)
-    elif board[1] == board[5] == board[9] and board[1] in ["X", "O"]:
-        winner = board[1]
-        game_over = True
-        print(f"Main diagonal win! Player {winner} wins!")
-
-    # Anti-diagonal: positions 3, 5, 7 (top-right to bottom-left)
-    elif board[3] == board[5] == board[7] and board[3] in ["X", "O"]:
-        winner = board[3]
-        game_over = True
-        print(f"Anti-diagonal win! Player {winner} wins!")
-
-    # CHECK FOR TIE GAME
-    # If no one has won and all 9 positions are filled, it's a tie
-    elif moves_made == 9:
-        winner = "Tie"
-        game_over = True
-        print("All positions filled - it's a tie game!")
-
-    # SWITCH PLAYERS (only if game is not over)
-    # After each move, we need to switch to the other player
+    # This section runs after the game loop ends
+    # It displays the final results
     # (This is identical to the nested lists version)
-    if not game_over:
-        if current_player == "X":
-            current_player = "O"  # Switch from X to O
-        else:
-            current_player = "X"  # Switch from O to X
 
-        print(f"Next turn: Player {current_player}")
-        print()
+    print()
+    print(SEPARATOR)
+    print("GAME OVER!")
+    print(SEPARATOR)
 
-# ============================================
-# GAME END SECTION
-# ============================================
-# This section runs after the game loop ends
-# It displays the final results
-# (This is identical to the nested lists version)
-
-print()
-print("=" * 30)
-print("GAME OVER!")
-print("=" * 30)
-
-if winner == "Tie":
-    print("The game ended in a tie!")
-    print("Both players played well!")
-else:
-    print(f"Congratulations! Player {winner} wins!")
-    print(f"Player {winner} got three in a row!")
-
-print()
-print("Final board:")
-print()
-
-# Display the final board one more time using dictionary access
-print(" " + board[1] + " | " + board[2] + " | " + board[3])
-print("-----------")
-print(" " + board[4] + " | " + board[5] + " | " + board[6])
-print("-----------")
-print(" " + board[7] + " | " + board[8] + " | " + board[9])
-
-print()
-print("Thanks for playing Tic-Tac-Toe!")
-print("This was the dictionary version - compare it with the nested lists version!")
-print()
-print("DICTIONARY vs NESTED LISTS SUMMARY:")
-print("Dictionary advantages:")
-print("- Direct position access (no math needed)")
-print("- Simple move processing")
-print("- Intuitive key-value mapping")
-print()
-print("Nested Lists advantages:")
-print("- Systematic win checking with loops")
-print("- Natural 2D representation")
-print("- Easier to scale to larger boards")
-print()
-print(
-    "Both approaches solve the same problem - choose what makes sense for your situation!"
-)
+    if winner == "Tie":
+        print("The game ended in a tie!")
+        print("Both players played well!")
+    else:
+        print(f"Congratulations! Player {winner} wins!")
+        print(f"Player {winner} got three in a row!")
+
+    print()
+    print("Final board:")
+    print()
+
+    # Display the final board one more time using dictionary access
+    sys.stdout.write(BOARD_TEMPLATE.format(
+        board_get(1), board_get(2), board_get(3),
+        board_get(4), board_get(5), board_get(6),
+        board_get(7), board_get(8), board_get(9),
+    ))
+
+    print()
+    print("Thanks for playing Tic-Tac-Toe!")
+    print("This was the dictionary version - compare it with the nested lists version!")
+    print()
+    print("DICTIONARY vs NESTED LISTS SUMMARY:")
+    print("Dictionary advantages:")
+    print("- Direct position access (no math needed)")
+    print("- Simple move processing")
+    print("- Intuitive key-value mapping")
+    print()
+    print("Nested Lists advantages:")
+    print("- Systematic win checking with loops")
+    print("- Natural 2D representation")
+    print("- Easier to scale to larger boards")
+    print()
+    print(
+        "Both approaches solve the same problem - choose what makes sense for your situation!"
+    )
+
+
+    print("end of file")
 
 
-print("end of file")
+# Only start the game when this file is run directly (python tictactoe_dict.py),
+# not when another file imports it
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,7 @@ learners who are just learning about lists, loops, and conditionals.
 
 Key concepts demonstrated:
 - Nested lists (lists inside lists)
-- For loops with range()
-- Nested for loops
+- For loops over a tuple of winning lines
 - List indexing with [row][column]
 - Input validation with try/except
 - While loops for game control
@@ -25,325 +24,361 @@ Python Level: Beginner (Week 3)
 Data Structure: Nested Lists
 """
 
+# sys gives us sys.stdout.write(), which prints a whole block of text at once
+import sys
+# io.StringIO is a "fake file" in memory - we can print into it and show it later
+import io
+
 # ============================================
 # GAME SETUP AND INITIALIZATION
 # ============================================
 # This section sets up all the variables we need for the game
 # We create the board and set the starting conditions
 
-print("Welcome to Tic-Tac-Toe - Nested Lists Version!")
-print("This version uses nested lists to store the game board.")
-print("You'll see how we use [row][column] indexing to access positions.")
-print()
-
-# board: This is a list that contains 3 other lists (nested list)
-# Each inner list represents one row of the tic-tac-toe board
-# The values start as strings '1' through '9' to show position numbers
-# When players make moves, we replace these with 'X' or 'O'
-board = [
-    ['1', '2', '3'],  # Row 0: positions 1, 2, 3 (top row)
-    ['4', '5', '6'],  # Row 1: positions 4, 5, 6 (middle row)  
-    ['7', '8', '9']   # Row 2: positions 7, 8, 9 (bottom row)
-]
-
-# current_player: A string that holds either 'X' or 'O'
-# This tells us whose turn it is to play
-# We start with 'X' because X always goes first in tic-tac-toe
-current_player = 'X'
-
-# game_over: A boolean (True or False) that tracks if the game has ended
-# We start with False because the game just began
-# This becomes True when someone wins or the board is full (tie)
-game_over = False
-
-# winner: A string that will hold 'X', 'O', or 'Tie' when the game ends
-# We start with an empty string because no one has won yet
-winner = ''
-
-# moves_made: An integer that counts how many moves have been made
-# We use this to detect tie games (when moves_made reaches 9)
-moves_made = 0
-
-print("Game setup complete! Here's how the nested list works:")
-print("board[0] =", board[0], "← This is the top row")
-print("board[1] =", board[1], "← This is the middle row") 
-print("board[2] =", board[2], "← This is the bottom row")
-print()
-print("To access a specific position, we use board[row][column]:")
-print("board[0][0] =", board[0][0], "← Top-left position")
-print("board[1][1] =", board[1][1], "← Center position")
-print("board[2][2] =", board[2][2], "← Bottom-right position")
-print()
-print("Let's start playing!")
-print()
+# DEBUG: Set this to True to see extra "behind the scenes" messages
+# while playing (like how each position becomes a row and column). Normal games leave it off
+# so each move prints less
+DEBUG = False
+
+# BOARD_TEMPLATE: The picture of the board, with a {} slot for each of the 9 cells
+# .format() fills the slots in order (left to right, top to bottom), so we can
+# draw the whole board with one write instead of many small print() calls
+BOARD_TEMPLATE = (
+    " {} | {} | {}\n"
+    "-----------\n"
+    " {} | {} | {}\n"
+    "-----------\n"
+    " {} | {} | {}\n"
+)
+
+# SEPARATOR: The line of = signs drawn above and below "GAME OVER!"
+# Built once here and reused, instead of working out "=" * 30 each time
+SEPARATOR = "=" * 30
+
+# PLAYERS: The two marks a cell can hold once someone has played there
+# A frozenset is a set that never changes - checking "in" it is very fast
+PLAYERS = frozenset("XO")
+
+# NEXT_PLAYER: Whose turn comes after each player
+# Looking the answer up in a dictionary replaces an if/else every turn
+NEXT_PLAYER = {"X": "O", "O": "X"}
+
+# WIN_LINES: Every way to get three in a row, written as [row][column] pairs
+# Each entry is (name, (cell, cell, cell)) so we can say which line won
+WIN_LINES = (
+    ("Row 0", ((0, 0), (0, 1), (0, 2))),           # Top row
+    ("Row 1", ((1, 0), (1, 1), (1, 2))),           # Middle row
+    ("Row 2", ((2, 0), (2, 1), (2, 2))),           # Bottom row
+    ("Column 0", ((0, 0), (1, 0), (2, 0))),        # Left column
+    ("Column 1", ((0, 1), (1, 1), (2, 1))),        # Middle column
+    ("Column 2", ((0, 2), (1, 2), (2, 2))),        # Right column
+    ("Main diagonal", ((0, 0), (1, 1), (2, 2))),   # Top-left to bottom-right
+    ("Anti-diagonal", ((0, 2), (1, 1), (2, 0))),   # Top-right to bottom-left
+)
+
+# PERFORMANCE NOTE: Very fast game programs often skip the board when checking
+# for a win. They keep each player's positions as the bits of one number (a
+# "bitmask") and test a whole line with a single & operation. That is faster,
+# but it hides the board - and reading board[row][column] cells is what this
+# version teaches, so our win check looks at the real board instead.
+
+# LINES_THROUGH: For each position, only the winning lines that include it
+# A move can only complete a line that goes through the cell just played,
+# so the center (5) needs 4 checks, corners need 3 and edges need only 2
+# Example: LINES_THROUGH[2] holds just the top row and the middle column
+LINES_THROUGH = {}
+for cell in range(1, 10):
+    cell_row_col = divmod(cell - 1, 3)  # Position 2 -> (0, 1)
+    LINES_THROUGH[cell] = tuple(
+        (line_name, cells)
+        for line_name, cells in WIN_LINES
+        if cell_row_col in cells
+    )
 
 # ============================================
-# BOARD DISPLAY SECTION
+# MAIN FUNCTION - The whole game lives in here
 # ============================================
-# This section contains code to show the current game board
-# It formats the board nicely so players can see the game state
+# Python looks up variables inside a function faster than variables at the
+# top level of a file, and the game reads board, current_player and friends
+# many times every turn - so we put the game inside main() and call it at
+# the bottom of the file
 
-def display_board():
+def main():
     """
-    Note: We're not using functions in this educational version!
-    This comment block shows what this section does, but the actual
-    code is written inline below to keep it simple for beginners.
-    
-    This section displays the current game board in a nice format.
-    It uses nested loops to go through each row and column.
+    Play one game of tic-tac-toe from the welcome message to the goodbye.
+
+    The constants above (BOARD_TEMPLATE, PLAYERS, ...) stay outside because
+    they never change; everything that changes during a game is created here.
     """
-    pass  # This line does nothing - it's just a placeholder
+    print("Welcome to Tic-Tac-Toe - Nested Lists Version!")
+    print("This version uses nested lists to store the game board.")
+    print("You'll see how we use [row][column] indexing to access positions.")
+    print()
 
-# Display the current board using nested loops
-# This is the heart of how we work with nested lists!
+    # board: This is a list that contains 3 other lists (nested list)
+    # Each inner list represents one row of the tic-tac-toe board
+    # The values start as strings '1' through '9' to show position numbers
+    # When players make moves, we replace these with 'X' or 'O'
+    board = [
+        ['1', '2', '3'],  # Row 0: positions 1, 2, 3 (top row)
+        ['4', '5', '6'],  # Row 1: positions 4, 5, 6 (middle row)  
+        ['7', '8', '9']   # Row 2: positions 7, 8, 9 (bottom row)
+    ]
 
-print("Current board:")
-print()
+    # PERFORMANCE NOTE: Programs that must be as fast as possible often store a
+    # board like this as one flat block of bytes, e.g. bytearray(b"123456789"),
+    # where board[position - 1] is a small number instead of a string inside a
+    # list inside a list. That is faster, but much harder to read - and learning
+    # nested lists is the whole point of this version, so we keep them here.
 
-# This outer loop goes through each row in our board
-# range(3) gives us the numbers 0, 1, 2 (for our three rows)
-# We use 'i' as our row number variable
-for i in range(3):
-    print(" ", end="")  # Print a space at the start of each row for formatting
-    
-    # This inner loop goes through each column in the current row
-    # range(3) gives us the numbers 0, 1, 2 (for our three columns)
-    # We use 'j' as our column number variable
-    for j in range(3):
-        # board[i][j] means: go to row i, then column j
-        # For example: board[0][1] is row 0, column 1 (position 2)
-        print(board[i][j], end="")
-        
-        # Add a vertical separator (|) between columns, but not after the last column
-        if j < 2:  # j < 2 means "if this is not the last column"
-            print(" | ", end="")
-    
-    # After printing all columns in this row, start a new line
-    print()  # This creates a line break to move to the next row
-    
-    # Add a horizontal separator line between rows, but not after the last row
-    if i < 2:  # i < 2 means "if this is not the last row"
-        print("-----------")
+    # current_player: A string that holds either 'X' or 'O'
+    # This tells us whose turn it is to play
+    # We start with 'X' because X always goes first in tic-tac-toe
+    current_player = 'X'
 
-print()  # Add an extra blank line after the board for better spacing
+    # game_over: A boolean (True or False) that tracks if the game has ended
+    # We start with False because the game just began
+    # This becomes True when someone wins or the board is full (tie)
+    game_over = False
 
-# ============================================
-# MAIN GAME LOOP - Keep playing until game ends
-# ============================================
-# This section contains the main game logic that repeats until someone wins
+    # winner: A string that will hold 'X', 'O', or 'Tie' when the game ends
+    # We start with an empty string because no one has won yet
+    winner = ''
+
+    # moves_made: An integer that counts how many moves have been made
+    # We use this to detect tie games (when moves_made reaches 9)
+    moves_made = 0
+
+    print("Game setup complete! Here's how the nested list works:")
+    print("board[0] =", board[0], "← This is the top row")
+    print("board[1] =", board[1], "← This is the middle row") 
+    print("board[2] =", board[2], "← This is the bottom row")
+    print()
+    print("To access a specific position, we use board[row][column]:")
+    print("board[0][0] =", board[0][0], "← Top-left position")
+    print("board[1][1] =", board[1][1], "← Center position")
+    print("board[2][2] =", board[2][2], "← Bottom-right position")
+    print()
+    print("Let's start playing!")
+    print()
+
+    # ============================================
+    # BOARD DISPLAY SECTION
+    # ============================================
+    # This section contains code to show the current game board
+    # It formats the board nicely so players can see the game state
+
+    # Note: We don't put the drawing code in its own function in this version.
+    # Each time the board is shown we use the same one-line statement, so you
+    # can read every step of the game in order from top to bottom.
+
+    # Display the current board using the template
+    # board[0] + board[1] + board[2] joins the three rows into one list of 9 cells,
+    # and the * spreads those 9 cells into the 9 {} slots of BOARD_TEMPLATE
+    # For example: board[0][1] (row 0, column 1) fills the 2nd slot (position 2)
+
+    print("Current board:")
+    print()
+
+    sys.stdout.write(BOARD_TEMPLATE.format(*(board[0] + board[1] + board[2])))
+
+    print()  # Add an extra blank line after the board for better spacing
 
-# Start the main game loop - this will keep running until game_over becomes True
-while not game_over:
-    
     # ============================================
-    # INPUT VALIDATION AND PROCESSING SECTION
+    # MAIN GAME LOOP - Keep playing until game ends
     # ============================================
-    # This section handles getting input from players
-    # It checks if the input is valid and converts it to the right format
+    # This section contains the main game logic that repeats until someone wins
+
+    # Start the main game loop - this will keep running until game_over becomes True
+    while not game_over:
+
+        # out: Collects everything this turn prints (print(..., file=out) writes
+        # into it), so the whole turn reaches the screen with one write at the end
+        # instead of many separate print() calls
+        out = io.StringIO()
     
-    # valid_move: A boolean that tracks whether the player's move is acceptable
-    # We start with False and only set it to True if all checks pass
-    valid_move = False
+        # ============================================
+        # INPUT VALIDATION AND PROCESSING SECTION
+        # ============================================
+        # This section handles getting input from players
+        # It checks if the input is valid and converts it to the right format
     
-    # Keep asking for input until we get a valid move
-    # This while loop will repeat until valid_move becomes True
-    while not valid_move:
-        
-        # Get input from the current player
+        # valid_move: A boolean that tracks whether the player's move is acceptable
+        # We start with False and only set it to True if all checks pass
+        valid_move = False
+    
+        # The question to ask the current player
         # f-strings let us put variables directly into strings
-        player_input = input(f"Player {current_player}, enter position (1-9): ")
+        # current_player doesn't change until the move is made, so we build the
+        # question once here instead of every time we have to ask again
+        prompt = f"Player {current_player}, enter position (1-9): "
+    
+        # Keep asking for input until we get a valid move
+        # This while loop will repeat until valid_move becomes True
+        while not valid_move:
         
-        # INPUT VALIDATION STEP 1: Check if input can be converted to a number
-        # We use try/except to catch errors if they enter letters or symbols
-        try:
-            # int() converts the string input to an integer (whole number)
-            # If the player typed letters, this will cause an error
-            position = int(player_input)
+            # Get input from the current player
+            player_input = input(prompt)
+        
+            # INPUT VALIDATION STEP 1: Check if input can be converted to a number
+            # We use try/except to catch errors if they enter letters or symbols
+            try:
+                # int() converts the string input to an integer (whole number)
+                # If the player typed letters, this will cause an error
+                position = int(player_input)
             
-            # INPUT VALIDATION STEP 2: Check if the number is in valid range
-            # Valid positions are 1, 2, 3, 4, 5, 6, 7, 8, 9
-            if position >= 1 and position <= 9:
-                
-                # COORDINATE CONVERSION: Convert position number to row and column
-                # This is the key math for working with nested lists!
-                # Position numbers 1-9 need to become row/column coordinates 0-2
+                # INPUT VALIDATION STEP 2: Check if the number is in valid range
+                # Valid positions are 1, 2, 3, 4, 5, 6, 7, 8, 9
+                if position >= 1 and position <= 9:
                 
-                # Calculate which row this position is in
-                # We subtract 1 because positions start at 1 but rows start at 0
-                # Then we divide by 3 and ignore the remainder (that's what // does)
-                row = (position - 1) // 3
+                    # COORDINATE CONVERSION: Convert position number to row and column
+                    # This is the key math for working with nested lists!
+                    # Position numbers 1-9 need to become row/column coordinates 0-2
                 
-                # Calculate which column this position is in  
-                # We use % (modulo) to get the remainder when dividing by 3
-                col = (position - 1) % 3
+                    # Calculate which row and column this position is in
+                    # We subtract 1 because positions start at 1 but rows start at 0
+                    # divmod(a, 3) divides by 3 and gives back two answers at once:
+                    # - the whole number part (same as a // 3) is the row
+                    # - the remainder (same as a % 3) is the column
+                    row, col = divmod(position - 1, 3)
                 
-                print(f"Position {position} converts to row {row}, column {col}")
+                    if DEBUG:
+                        print(f"Position {position} converts to row {row}, column {col}", file=out)
                 
-                # INPUT VALIDATION STEP 3: Check if the position is empty
-                # A position is empty if it still contains its original number
-                # If it contains 'X' or 'O', then it's already taken
-                if board[row][col] not in ['X', 'O']:
-                    # Position is empty! We can make this move
-                    valid_move = True
-                    print(f"Valid move! Placing {current_player} at position {position}")
-                else:
-                    # Position is already taken
-                    print(f"Position {position} is already taken by {board[row][col]}. Choose an empty position.")
+                    # INPUT VALIDATION STEP 3: Check if the position is empty
+                    # A position is empty if it still contains its original number
+                    # If it contains 'X' or 'O', then it's already taken
+                    if board[row][col] not in PLAYERS:
+                        # Position is empty! We can make this move
+                        valid_move = True
+                        print(f"Valid move! Placing {current_player} at position {position}", file=out)
+                    else:
+                        # Position is already taken
+                        print(f"Position {position} is already taken by {board[row][col]}. Choose an empty position.", file=out)
                     
-            else:
-                # The number is outside our valid range (less than 1 or greater than 9)
-                print("Please enter a number between 1 and 9")
+                else:
+                    # The number is outside our valid range (less than 1 or greater than 9)
+                    print("Please enter a number between 1 and 9", file=out)
                 
-        except:
-            # This runs if int() failed because they entered non-numbers
-            print("Please enter a number, not letters or symbols")
+            except ValueError:
+                # This runs if int() failed because they entered non-numbers
+                # (int() raises ValueError for text like "abc"; naming it means
+                # other problems - like pressing Ctrl+C - are not hidden here)
+                print("Please enter a number, not letters or symbols", file=out)
+
+            # If the move was rejected, show why right away - before asking again
+            if not valid_move:
+                sys.stdout.write(out.getvalue())
+                out = io.StringIO()
     
-    # MAKE THE MOVE: Update the board with the player's choice
-    # At this point we know the move is valid, so we can safely update the board
-    board[row][col] = current_player
-    moves_made = moves_made + 1  # Keep track of how many moves have been made
+        # MAKE THE MOVE: Update the board with the player's choice
+        # At this point we know the move is valid, so we can safely update the board
+        board[row][col] = current_player
+        moves_made += 1  # Keep track of how many moves have been made (+= 1 adds one)
     
-    print(f"Move made! {current_player} placed at row {row}, column {col}")
-    print()
+        print(f"Move made! {current_player} placed at row {row}, column {col}", file=out)
+        print(file=out)
     
-    # DISPLAY UPDATED BOARD: Show the board after the move
-    print("Updated board:")
-    print()
+        # DISPLAY UPDATED BOARD: Show the board after the move
+        print("Updated board:", file=out)
+        print(file=out)
     
-    # Display the board again using the same nested loop structure
-    for i in range(3):
-        print(" ", end="")
-        for j in range(3):
-            print(board[i][j], end="")
-            if j < 2:
-                print(" | ", end="")
-        print()
-        if i < 2:
-            print("-----------")
+        # Display the board again using the same template
+        out.write(BOARD_TEMPLATE.format(*(board[0] + board[1] + board[2])))
     
-    print()
+        print(file=out)
     
-    # ============================================
-    # WIN DETECTION SECTION
-    # ============================================
-    # This section checks if someone has won the game
-    # We need to check all possible winning combinations
-    
-    # CHECK FOR ROW WINS (horizontal lines)
-    # We need to check if any row has three of the same symbol
-    for i in range(3):  # Check each of the 3 rows
-        # Check if all three positions in this row are the same
-        # AND make sure they're not empty (not just numbers)
-        if (board[i][0] == board[i][1] == board[i][2] and 
-            board[i][0] in ['X', 'O']):
-            winner = board[i][0]  # The winner is whoever has three in this row
-            game_over = True
-            print(f"Row {i} win! Player {winner} wins!")
-            break  # Stop checking once we find a winner
+        # ============================================
+        # WIN DETECTION SECTION
+        # ============================================
+        # This section checks if someone has won the game
+        # We never need to check the other player - they didn't just move -
+        # so the win test only ever looks at current_player's positions
     
-    # CHECK FOR COLUMN WINS (vertical lines)
-    # Only check if no one has won yet
-    if not game_over:
-        for j in range(3):  # Check each of the 3 columns
-            # Check if all three positions in this column are the same
-            # AND make sure they're not empty (not just numbers)
-            if (board[0][j] == board[1][j] == board[2][j] and 
-                board[0][j] in ['X', 'O']):
-                winner = board[0][j]  # The winner is whoever has three in this column
+        # CHECK THE WINNING LINES THROUGH THE CELL JUST PLAYED
+        # A move can only complete a line that goes through its own cell, so we
+        # only check those lines. The loop "unpacks" each entry: line_name gets
+        # the name, and the three (row, column) pairs go into (r1, c1), (r2, c2)
+        # and (r3, c3)
+        for line_name, ((r1, c1), (r2, c2), (r3, c3)) in LINES_THROUGH[position]:
+            # All three cells in this line must hold the current player's mark
+            if current_player == board[r1][c1] == board[r2][c2] == board[r3][c3]:
+                winner = current_player
                 game_over = True
-                print(f"Column {j} win! Player {winner} wins!")
+                print(f"{line_name} win! Player {winner} wins!", file=out)
                 break  # Stop checking once we find a winner
     
-    # CHECK FOR DIAGONAL WINS
-    # Only check if no one has won yet
-    if not game_over:
-        # Check main diagonal (top-left to bottom-right)
-        # Positions: board[0][0], board[1][1], board[2][2]
-        if (board[0][0] == board[1][1] == board[2][2] and 
-            board[0][0] in ['X', 'O']):
-            winner = board[0][0]
-            game_over = True
-            print(f"Main diagonal win! Player {winner} wins!")
-        
-        # Check anti-diagonal (top-right to bottom-left)
-        # Positions: board[0][2], board[1][1], board[2][0]
-        elif (board[0][2] == board[1][1] == board[2][0] and 
-              board[0][2] in ['X', 'O']):
-            winner = board[0][2]
+        # CHECK FOR TIE GAME
+        # If no one has won and all 9 positions are filled, it's a tie
+        # moves_made always matches the number of filled positions, so we can
+        # trust it here instead of looking through the whole board
+        if not game_over and moves_made == 9:
+            winner = 'Tie'
             game_over = True
-            print(f"Anti-diagonal win! Player {winner} wins!")
+            print("All positions filled - it's a tie game!", file=out)
     
-    # CHECK FOR TIE GAME
-    # If no one has won and all 9 positions are filled, it's a tie
-    if not game_over and moves_made == 9:
-        winner = 'Tie'
-        game_over = True
-        print("All positions filled - it's a tie game!")
-    
-    # SWITCH PLAYERS (only if game is not over)
-    # After each move, we need to switch to the other player
-    if not game_over:
-        if current_player == 'X':
-            current_player = 'O'  # Switch from X to O
-        else:
-            current_player = 'X'  # Switch from O to X
+        # SWITCH PLAYERS (only if game is not over)
+        # After each move, we need to switch to the other player
+        if not game_over:
+            current_player = NEXT_PLAYER[current_player]  # X -> O, O -> X
         
-        print(f"Next turn: Player {current_player}")
-        print()
+            print(f"Next turn: Player {current_player}", file=out)
+            print(file=out)
 
-# ============================================
-# GAME END SECTION
-# ============================================
-# This section runs after the game loop ends
-# It displays the final results
-
-print()
-print("=" * 30)
-print("GAME OVER!")
-print("=" * 30)
-
-if winner == 'Tie':
-    print("The game ended in a tie!")
-    print("Both players played well!")
-else:
-    print(f"Congratulations! Player {winner} wins!")
-    print(f"Player {winner} got three in a row!")
-
-print()
-print("Final board:")
-print()
-
-# Display the final board one more time
-for i in range(3):
-    print(" ", end="")
-    for j in range(3):
-        print(board[i][j], end="")
-        if j < 2:
-            print(" | ", end="")
-    print()
-    if i < 2:
-        print("-----------")
+        # Show everything this turn printed, all at once
+        sys.stdout.write(out.getvalue())
 
-print()
+    # ============================================
+    # GAME END SECTION
+    # ============================================
+    # This section runs after the game loop ends
+    # It displays the final results
 
-# ============================================
-# PLAY AGAIN FUNCTIONALITY
-# ============================================
-# Ask if the players want to play another game
+    print()
+    print(SEPARATOR)
+    print("GAME OVER!")
+    print(SEPARATOR)
 
-play_again = input("Would you like to play again? (y/n): ").lower()
+    if winner == 'Tie':
+        print("The game ended in a tie!")
+        print("Both players played well!")
+    else:
+        print(f"Congratulations! Player {winner} wins!")
+        print(f"Player {winner} got three in a row!")
 
-if play_again == 'y' or play_again == 'yes':
     print()
-    print("Starting a new game...")
-    print("To play again, run this program again!")
-    print("In a more advanced version, we could restart the game automatically.")
-else:
+    print("Final board:")
+    print()
+
+    # Display the final board one more time
+    sys.stdout.write(BOARD_TEMPLATE.format(*(board[0] + board[1] + board[2])))
+
     print()
-    print("Thanks for playing Tic-Tac-Toe!")
-    print("This was the nested lists version - try the dictionary version next!")
-    print("You learned about:")
-    print("- Nested lists and [row][column] indexing")
-    print("- Converting position numbers to coordinates")
-    print("- Using loops for systematic checking")
-    print("- Input validation and error handling")
\ No newline at end of file
+
+    # ============================================
+    # PLAY AGAIN FUNCTIONALITY
+    # ============================================
+    # Ask if the players want to play another game
+
+    play_again = input("Would you like to play again? (y/n): ").lower()
+
+    if play_again == 'y' or play_again == 'yes':
+        print()
+        print("Starting a new game...")
+        print("To play again, run this program again!")
+        print("In a more advanced version, we could restart the game automatically.")
+    else:
+        print()
+        print("Thanks for playing Tic-Tac-Toe!")
+        print("This was the nested lists version - try the dictionary version next!")
+        print("You learned about:")
+        print("- Nested lists and [row][column] indexing")
+        print("- Converting position numbers to coordinates")
+        print("- Using loops for systematic checking")
+        print("- Input validation and error handling")
+
+
+# Only start the game when this file is run directly (python tictactoe_lists.py),
+# not when another file imports it
+if __name__ == "__main__":
+    main()